@@ -0,0 +1,47 @@
+"""
+Phrase frequency analytics.
+
+Works on a table with one row per (video, phrase) holding the number of matches
+and the hours of content in the video, and aggregates it per video or per month
+of publish date.
+"""
+import numpy as np
+import pandas as pd
+
+COUNT_COLUMNS = ["video_id", "title", "publish_date", "hours", "phrase", "count"]
+
+
+def per_video(counts):
+    table = counts.copy()
+    table["rate_per_hour"] = table["count"] / table["hours"].replace(0, np.nan)
+    return table.sort_values(["phrase", "publish_date", "video_id"]).reset_index(drop=True)
+
+
+def per_month(counts):
+    """Sum counts and hours per publish month. Videos without a known publish date are left out."""
+    table = counts.copy()
+    published = pd.to_datetime(table["publish_date"], utc=True, errors="coerce")
+    table["month"] = published.dt.strftime("%Y-%m")
+    table = table[published.notna()]
+
+    monthly = (
+        table.groupby(["phrase", "month"], as_index=False)
+        .agg(videos=("video_id", "nunique"), count=("count", "sum"), hours=("hours", "sum"))
+    )
+    monthly["rate_per_hour"] = monthly["count"] / monthly["hours"].replace(0, np.nan)
+    return monthly.sort_values(["phrase", "month"]).reset_index(drop=True)
+
+
+def aggregate(counts, by):
+    if by == "month":
+        return per_month(counts)
+    if by == "video":
+        return per_video(counts)
+    raise ValueError(f"Unknown analytics grouping: {by}")
+
+
+def write_table(table, path):
+    if path.endswith(".json"):
+        table.to_json(path, orient="records", indent=2)
+    else:
+        table.to_csv(path, header=True, index=False)
@@ -0,0 +1,147 @@
+"""
+Fuzzy phrase matching over positional transcript indexes.
+
+Each word of the phrase is compared against the vocabulary of a transcript through
+a character n-gram index: only words sharing enough n-grams to be within the edit
+distance threshold are verified with an edit distance computation, and verified
+words are remembered across transcripts. Each phrase word uses the longest n-gram
+size that still leaves a positive bound on shared n-grams, so short words fall back
+to bigrams. Phrase matches are then checked only at
+the positions where a candidate for the first word occurs.
+
+Matches have the same number of words as the phrase. The edit distance threshold
+applies to the whole phrase, summed over its words.
+"""
+NGRAM_SIZES = (3, 2)
+
+
+def edit_distance(a, b, max_distance):
+    """Levenshtein distance between a and b, or max_distance + 1 once it is known to be larger."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+def ngrams(word, size):
+    padded = "#" + word + "#"
+    return [padded[i:i + size] for i in range(max(len(padded) - size + 1, 1))]
+
+
+def min_shared_ngrams(word, size, max_distance):
+    """
+    Fewest distinct n-grams a word within max_distance edits of word must share with it.
+    Each edit changes at most size of the word's n-grams.
+    """
+    return len(set(ngrams(word, size))) - size * max_distance
+
+
+def pick_ngram_size(word, max_distance):
+    """Longest n-gram size that can filter candidates for word, or None if none can."""
+    for size in NGRAM_SIZES:
+        if min_shared_ngrams(word, size, max_distance) > 0:
+            return size
+    return None
+
+
+def build_ngram_index(vocabulary, sizes=NGRAM_SIZES):
+    """Map each n-gram of the given sizes to the vocabulary words containing it."""
+    index = {}
+    for word in vocabulary:
+        for size in sizes:
+            for gram in set(ngrams(word, size)):
+                index.setdefault(gram, []).append(word)
+    return index
+
+
+def make_matcher(phrase, max_distance):
+    """
+    Fuzzy matcher for a phrase. Holds the verified edit distance of every vocabulary
+    word seen so far, for each word of the phrase.
+    """
+    words = phrase.split()
+    return {
+        "words": words,
+        "max_distance": max_distance,
+        "length": max(len("".join(words)), 1),
+        "ngram_sizes": [pick_ngram_size(word, max_distance) for word in words],
+        "verified": [{} for _ in words],
+    }
+
+
+def candidate_words(matcher, j, vocabulary, ngram_index):
+    """Vocabulary words within the edit distance threshold of phrase word j, with their distances."""
+    word = matcher["words"][j]
+    max_distance = matcher["max_distance"]
+    verified = matcher["verified"][j]
+
+    size = matcher["ngram_sizes"][j]
+    if size is not None:
+        word_grams = set(ngrams(word, size))
+        min_shared = min_shared_ngrams(word, size, max_distance)
+        shared = {}
+        for gram in word_grams:
+            for other in ngram_index.get(gram, []):
+                shared[other] = shared.get(other, 0) + 1
+        plausible = [other for other, count in shared.items() if count >= min_shared]
+    else:
+        # Short words: too few n-grams to filter on, so filter on length alone
+        plausible = [other for other in vocabulary if abs(len(other) - len(word)) <= max_distance]
+
+    candidates = {}
+    for other in plausible:
+        if other not in verified:
+            verified[other] = edit_distance(word, other, max_distance)
+        if verified[other] <= max_distance:
+            candidates[other] = verified[other]
+    return candidates
+
+
+def find_matches(matcher, index):
+    """
+    Fuzzy matches of the phrase in one transcript as (first, last, similarity) in order,
+    where similarity is 1 minus the edit distance over the length of the phrase.
+    Overlapping matches are dropped in favour of the earliest.
+    """
+    tokens = index["tokens"]
+    num_words = len(matcher["words"])
+    if num_words == 0:
+        return []
+
+    sizes = {size for size in matcher["ngram_sizes"] if size is not None}
+    ngram_index = build_ngram_index(index["vocabulary"], sizes)
+    candidates = [candidate_words(matcher, j, index["vocabulary"], ngram_index) for j in range(num_words)]
+    if any(len(word_candidates) == 0 for word_candidates in candidates):
+        return []
+
+    starts = sorted(p for word in candidates[0] for p in index["positions"][word])
+
+    matches = []
+    for first in starts:
+        last = first + num_words - 1
+        if last >= len(tokens) or (matches and first <= matches[-1][1]):
+            continue
+
+        distance = 0
+        for j in range(num_words):
+            word_distance = candidates[j].get(tokens[first + j])
+            if word_distance is None:
+                break
+            distance += word_distance
+            if distance > matcher["max_distance"]:
+                break
+        else:
+            matches.append((first, last, 1 - distance / matcher["length"]))
+    return matches
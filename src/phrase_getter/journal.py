@@ -0,0 +1,60 @@
+"""
+Append-only job journal for clip runs.
+
+Each line records the latest status of one manifest row. Lines are flushed and
+synced to disk as they are written, so after a crash the journal can be replayed
+and a partially written last line is ignored.
+"""
+import os
+import json
+import datetime as dt
+
+STATUSES = ("pending", "downloading", "encoding", "done", "failed")
+
+
+def row_key(video_id, timestamp):
+    return f"{video_id}@{timestamp}"
+
+
+def load_journal(path):
+    """Replay a journal into a dict mapping row key -> latest entry."""
+    entries = {}
+    if not os.path.exists(path):
+        return entries
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            entries[entry["key"]] = entry
+    return entries
+
+
+def reset_journal(path):
+    """Start an empty journal, discarding any previous job."""
+    journal_dir = os.path.dirname(path)
+    if journal_dir and not os.path.exists(journal_dir):
+        os.makedirs(journal_dir)
+    open(path, "w").close()
+
+
+def record(path, entries):
+    """Append status entries to the journal and sync them to disk."""
+    now = dt.datetime.now(dt.timezone.utc).isoformat()
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries:
+            if entry["status"] not in STATUSES:
+                raise ValueError(f"Unknown journal status: {entry['status']}")
+            f.write(json.dumps(dict(entry, time=now)) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def summarize(entries):
+    """Count journal entries by status."""
+    counts = {status: 0 for status in STATUSES}
+    for entry in entries.values():
+        counts[entry["status"]] += 1
+    return counts
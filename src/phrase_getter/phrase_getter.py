@@ -5,6 +5,10 @@ import re
 import argparse
 import json
 import datetime as dt
+import subprocess
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 from yt_dlp import YoutubeDL
@@ -15,6 +19,11 @@ from dotenv import load_dotenv
 
 import vtt_tools as vtt
 import visemes
+import journal
+import transcript_index
+import query
+import analytics
+import fuzzy
 
 import traceback
 import sys
@@ -22,6 +31,17 @@ import sys
 load_dotenv()
 
 
+def report(config, message):
+    """Send a progress message to the configured progress callback, or print it."""
+    progress = config.get("progress") if config else None
+    (progress or print)(message)
+
+
+def is_cancelled(config):
+    """True once the caller's cancel event, or the run's own stop event, is set."""
+    return any(event is not None and event.is_set() for event in (config.get("cancel"), config.get("stop")))
+
+
 def stamp_to_dt(stamp):
     return dt.datetime.strptime(stamp, "%H:%M:%S.%f")
 
@@ -30,6 +50,10 @@ def dt_to_stamp(date):
     return dt.datetime.strftime(date, "%H:%M:%S.%f")
 
 
+def stamp_to_seconds(stamp):
+    return (stamp_to_dt(stamp) - dt.datetime(1900, 1, 1)).total_seconds()
+
+
 def make_config(args):
     # Handle both argparse.Namespace and dict inputs
     if isinstance(args, dict):
@@ -39,13 +63,29 @@ def make_config(args):
 
     channel_root = f"{config['output_directory']}{config['channel_name']}/"
 
+    if config.get("query"):
+        if config["viseme_equivalent"]:
+            raise ValueError("Queries cannot be combined with viseme-equivalent search.")
+        if config.get("fuzzy") is not None:
+            raise ValueError("Queries cannot be combined with fuzzy search.")
+        # Fail early on malformed queries
+        query.parse(config["phrase"], norm_txt)
+        phrase_name = query.slug(config["phrase"])
+    else:
+        phrase_name = norm_txt(config["phrase"])
+
+    # Upgrades always write full-quality clips
+    if config.get("upgrade"):
+        config["preview"] = False
+    clips_root = channel_root + ("clips_preview/" if config.get("preview") else "clips/")
+
     config["paths"] = {
         "root": channel_root,
         "catalog": channel_root + "catalog.json",
         "video_dates": channel_root + "video_dates.json",
-        "clips": channel_root + "clips/" + norm_txt(config["phrase"] + "/"),
+        "clips": clips_root + phrase_name,
         "full_videos": channel_root + "full_videos/",
-        "manifest": channel_root + "manifests/" + norm_txt(config["phrase"]) + ".csv",
+        "manifest": channel_root + "manifests/" + phrase_name + ".csv",
         "manifest_root": channel_root + "manifests/",
         "transcripts": {
             "vtt": channel_root + "transcripts/",
@@ -56,19 +96,57 @@ def make_config(args):
 
     if config["viseme_equivalent"]:
         config["phrase_vis"] = visemes.txt_to_viseme(norm_txt(config["phrase"]))
-        config["paths"]["clips"] = channel_root + "clips/" + norm_txt(config["phrase"]) + "_vis/"
+        config["paths"]["clips"] = clips_root + norm_txt(config["phrase"]) + "_vis/"
         config["paths"]["manifest"] = channel_root + "manifests/" + norm_txt(config["phrase"]) + "_vis.csv"
 
+    if config.get("fuzzy") is not None:
+        fuzzy_suffix = f"_fuzzy{config['fuzzy']}"
+        config["paths"]["clips"] = config["paths"]["clips"].rstrip("/") + fuzzy_suffix + "/"
+        config["paths"]["manifest"] = config["paths"]["manifest"][:-len(".csv")] + fuzzy_suffix + ".csv"
+
+    # Supercut segments share one encoding, so keep them apart from ordinary clips
+    if config.get("supercut"):
+        config["paths"]["clips"] = config["paths"]["clips"].rstrip("/") + "_supercut/"
+    clips_name = os.path.basename(config["paths"]["clips"].rstrip("/"))
+    # Preview and full-quality runs of a phrase share clips_name, so name outputs by tier too
+    tier_suffix = "_preview" if config.get("preview") else ""
+    config["paths"]["supercut"] = channel_root + "supercuts/" + clips_name + tier_suffix + ".mp4"
+    config["paths"]["journal"] = channel_root + "journals/" + clips_name + tier_suffix + ".jsonl"
+    config["paths"]["manifest_index"] = config["paths"]["manifest"][:-len(".csv")] + ".index.json"
+
+    if config.get("analytics"):
+        if config["viseme_equivalent"]:
+            raise ValueError("Analytics cannot be combined with viseme-equivalent search.")
+        if config.get("fuzzy") is not None:
+            raise ValueError("Analytics cannot be combined with fuzzy search.")
+        config["analytics_phrases"] = [config["phrase"]] + list(config.get("analytics_phrase") or [])
+        if len(config["analytics_phrases"]) > 1:
+            analytics_name = query.slug(" | ".join(config["analytics_phrases"]))
+        else:
+            analytics_name = phrase_name
+        extension = ".json" if config.get("analytics_format") == "json" else ".csv"
+        config["paths"]["analytics"] = (
+            channel_root + "analytics/" + analytics_name + "_by_" + config["analytics"] + extension
+        )
+
     config["overwrite"] = {
         'manifest': not config["skip_manifest"],
         'vtt': False,
-        'tsv': False,
-        'vis': False,
+        'tsv': bool(config.get("rebuild_transcripts", False)),
+        'vis': bool(config.get("rebuild_transcripts", False)),
         'full_videos': False,
     }
 
     config["constants"] = {
-        "DEFAULT_SLEEP_INTERVAL": 1.0  # for youtube-dl API calls
+        "DEFAULT_SLEEP_INTERVAL": 1.0,  # for youtube-dl API calls
+        "PREVIEW_HEIGHT": 360,
+        "PREVIEW_PRESET": "ultrafast",
+        "PREVIEW_VIDEO_BITRATE": "400k",
+        "PREVIEW_AUDIO_BITRATE": "64k",
+        "SUPERCUT_HEIGHT": 720,
+        "SUPERCUT_FPS": 30,
+        "SUPERCUT_AUDIO_RATE": 48000,
+        "TIGHT_PADDING_SECONDS": 0.3,
     }
 
     return config
@@ -112,14 +190,14 @@ def get_existing_video_ids(config):
     return existing_ids
 
 
-def fetch_video_dates_batch(video_ids):
+def fetch_video_dates_batch(video_ids, config=None):
     """
     Fetch publish dates for multiple video IDs using YouTube Data API v3.
     Returns dict mapping video_id -> publish_date (as ISO string).
     """
     api_key = os.getenv("YOUTUBE_API_KEY")
     if not api_key:
-        print("Warning: YOUTUBE_API_KEY not found in environment. Cannot fetch video dates.")
+        report(config, "Warning: YOUTUBE_API_KEY not found in environment. Cannot fetch video dates.")
         return {}
     
     video_dates = {}
@@ -143,7 +221,7 @@ def fetch_video_dates_batch(video_ids):
             
             if response.status_code != 200:
                 error_msg = data.get("error", {}).get("message", "Unknown error")
-                print(f"YouTube API error ({response.status_code}): {error_msg}")
+                report(config, f"YouTube API error ({response.status_code}): {error_msg}")
                 continue
             
             for item in data.get("items", []):
@@ -153,7 +231,7 @@ def fetch_video_dates_batch(video_ids):
                 video_dates[video_id] = published_at
                 
         except Exception as e:
-            print(f"Error fetching video dates for batch: {e}")
+            report(config, f"Error fetching video dates for batch: {e}")
     
     return video_dates
 
@@ -183,11 +261,11 @@ def get_video_dates(config, video_ids):
     missing_ids = [vid for vid in video_ids if vid not in cached_dates]
     
     if missing_ids:
-        print(f"Fetching dates for {len(missing_ids)} videos from YouTube API...")
-        new_dates = fetch_video_dates_batch(missing_ids)
+        report(config, f"Fetching dates for {len(missing_ids)} videos from YouTube API...")
+        new_dates = fetch_video_dates_batch(missing_ids, config)
         cached_dates.update(new_dates)
         save_video_dates_cache(config, cached_dates)
-        print(f"Cached {len(new_dates)} new video dates.")
+        report(config, f"Cached {len(new_dates)} new video dates.")
     
     return cached_dates
 
@@ -229,7 +307,7 @@ def get_catalog(config, force_refresh=False):
 
     # Skip if catalog exists unless force refresh requested
     if os.path.exists(config["paths"]["catalog"]) and not force_refresh:
-        print(f"Using existing catalog. Use --force-catalog to refresh.")
+        report(config, f"Using existing catalog. Use --force-catalog to refresh.")
         return
 
     ydl_opts = {
@@ -268,8 +346,8 @@ def get_subtitles(video_id, config):
         with YoutubeDL(ydl_opts) as ydl:
             ydl.download(video_url)
     except Exception as e:
-        print("Could not get subtitles for video:")
-        print(video_url)
+        report(config, "Could not get subtitles for video:")
+        report(config, video_url)
 
 
 def get_all_subtitles(config, incremental=True):
@@ -279,7 +357,7 @@ def get_all_subtitles(config, incremental=True):
     # Get existing video IDs for incremental mode
     existing_ids = get_existing_video_ids(config) if incremental else set()
     if incremental and existing_ids:
-        print(f"Found {len(existing_ids)} existing transcripts. Will only download new ones.")
+        report(config, f"Found {len(existing_ids)} existing transcripts. Will only download new ones.")
 
     # Collect all video entries from catalog
     all_entries = []
@@ -293,7 +371,7 @@ def get_all_subtitles(config, incremental=True):
     # Filter to only new videos if incremental
     if incremental:
         new_entries = [e for e in all_entries if e['id'] not in existing_ids]
-        print(f"Found {len(new_entries)} new videos to download transcripts for.")
+        report(config, f"Found {len(new_entries)} new videos to download transcripts for.")
     else:
         new_entries = all_entries
 
@@ -302,7 +380,7 @@ def get_all_subtitles(config, incremental=True):
         try:
             get_subtitles(entry['id'], config)
         except:
-            print(f"Could not get subtitles for {entry}")
+            report(config, f"Could not get subtitles for {entry}")
 
 
 def convert_all_subs_to_tsv(config):
@@ -334,7 +412,70 @@ def download_video(video_id, config):
         ydl.download(video_url)
 
 
+def get_row_times(transcript, row, config):
+    """Start times of the searchable words in one transcript row."""
+    word_times = transcript.loc[row, "word_times"] if "word_times" in transcript.columns else ""
+    words = transcript_index.row_word_times(transcript.loc[row, "text"], transcript.loc[row, "start"], word_times)
+    if config["viseme_equivalent"]:
+        return [time for word, time in words]
+    return [time for word, time in words if norm_txt(word)]
+
+
+def row_has_word_times(transcript, row):
+    if "word_times" not in transcript.columns:
+        return False
+    return transcript_index.has_word_times(transcript.loc[row, "text"], transcript.loc[row, "word_times"])
+
+
+def get_match_times(transcript, first_row, last_row, text, phrase, config):
+    """
+    Get the start of the first matched word and the end of the last matched word of a phrase
+    found in text, which joins transcript rows first_row to last_row.
+    Falls back to the row start and an unknown end when word timings are unavailable.
+    """
+    times = []
+    for row in range(first_row, last_row + 1):
+        times += get_row_times(transcript, row, config)
+    if len(times) != len(text.split()):
+        return transcript.loc[first_row, "start"], ""
+
+    offset = text.find(phrase)
+    prefix = text[:offset]
+    first_word = len(prefix.split())
+    if prefix and not prefix[-1].isspace():
+        # phrase starts inside a word
+        first_word -= 1
+    last_word = len(text[:offset + len(phrase)].split()) - 1
+
+    if not all(row_has_word_times(transcript, row) for row in range(first_row, last_row + 1)):
+        # Only row start times are known, which say nothing about where the phrase ends
+        return times[first_word], ""
+
+    # The phrase ends where the next word with a later start time begins
+    following = times[last_word + 1:]
+    if last_row + 1 < len(transcript):
+        following += get_row_times(transcript, last_row + 1, config) or [transcript.loc[last_row + 1, "start"]]
+    elif "end" in transcript.columns:
+        following.append(transcript.loc[last_row, "end"])
+    end = next((time for time in following if time != times[last_word]), "")
+    return times[first_word], end
+
+
+def read_transcript_tsv(path, config):
+    """Read a TSV transcript, or return None with a warning if it cannot be parsed."""
+    try:
+        return transcript_index.read_transcript(path)
+    except Exception as e:
+        report(config, f"Warning: Could not parse {os.path.basename(path)}: {e}")
+        return None
+
+
 def get_instances(filename, config):
+    """
+    Find instances of the phrase in one transcript.
+    Returns a dict per instance with the start timestamp of the phrase and, where word
+    timings allow, the end timestamp of its last word.
+    """
     if config["viseme_equivalent"]:
         transcript_dir = config["paths"]["transcripts"]["vis"]
         phrase = config["phrase_vis"]
@@ -343,20 +484,15 @@ def get_instances(filename, config):
         phrase = norm_txt(config["phrase"])
 
     matching_files = [f for f in os.listdir(transcript_dir) if f.startswith(filename)]
-    filename_with_ext = matching_files[0]
-
-    try:
-        transcript = pd.read_csv(
-            transcript_dir + filename_with_ext, sep="\t",
-            keep_default_na=False,
-            on_bad_lines='skip',
-            quoting=3  # QUOTE_NONE - ignore quote characters
-        )
-    except Exception as e:
-        print(f"Warning: Could not parse {filename_with_ext}: {e}")
+    transcript = read_transcript_tsv(transcript_dir + matching_files[0], config)
+    if transcript is None:
         return []
+    return find_instances(transcript, phrase, config)
+
 
-    timestamps = []
+def find_instances(transcript, phrase, config):
+    """Find instances of an already normalized phrase in a loaded transcript."""
+    instances = []
 
     phrase_words = phrase.split(" ")
     for i in range(len(transcript)):
@@ -372,7 +508,8 @@ def get_instances(filename, config):
             cur_phrase += word
             if cur_phrase in cur_text:
                 if cur_phrase == phrase:
-                    timestamps.append(transcript.loc[i, "start"])
+                    start, end = get_match_times(transcript, i, cur_line_u, cur_text, phrase, config)
+                    instances.append({"timestamp": start, "end_timestamp": end})
                 elif cur_text.endswith(cur_phrase):
                     while cur_text.endswith(cur_phrase) and (cur_line_u < (len(transcript)-1)):
                         cur_line_u += 1
@@ -383,113 +520,477 @@ def get_instances(filename, config):
             else:
                 break
 
-    return timestamps
+    return instances
 
 
-def make_manifest(config):
-    if config['overwrite']['manifest'] or not os.path.exists(config["paths"]["manifest"]):
-        manifest = pd.DataFrame({
-            "video_id": [],
-            "title": [],
-            "phrase": [],
-            "timestamp": [],
-            "publish_date": []
-        })
-        num_videos = 0
+MANIFEST_COLUMNS = ["video_id", "title", "phrase", "timestamp", "end_timestamp", "publish_date"]
 
-        if config["viseme_equivalent"]:
-            transcript_dir = config["paths"]["transcripts"]["vis"]
-            phrase = visemes.txt_to_viseme(norm_txt(config["phrase"]))
-        else:
-            transcript_dir = config["paths"]["transcripts"]["tsv"]
-            phrase = norm_txt(config["phrase"])
-
-        print(f"Making manifest for phrase \"{config['phrase']}\"...")
-
-        # Get all transcript files and extract video info
-        all_files = []
-        for path in os.listdir(transcript_dir):
-            filename = path.replace(".tsv", "")
-            components = re.search(r'(.*)---(.*)', filename)
-            if components:
-                all_files.append({
-                    'filename': filename,
-                    'video_id': components.group(1),
-                    'title': components.group(2)
-                })
-
-        # Apply date filtering if specified, or fetch dates for timestamp overlay
-        start_date = parse_date_arg(config.get("start_date"))
-        end_date = parse_date_arg(config.get("end_date"))
-        need_dates = start_date or end_date or config.get("timestamp_videos", False)
-        
-        if need_dates:
-            video_ids = [f['video_id'] for f in all_files]
-            video_dates = get_video_dates(config, video_ids)
-            
-            if start_date or end_date:
-                filtered_ids = set(filter_videos_by_date(video_ids, video_dates, start_date, end_date))
-                all_files = [f for f in all_files if f['video_id'] in filtered_ids]
-                print(f"After date filtering: {len(all_files)} videos in range.")
-        else:
-            video_dates = {}
 
-        for file_info in all_files:
-            filename = file_info['filename']
-            video_id = file_info['video_id']
-            title = file_info['title']
+def manifest_settings(config):
+    """Settings which change manifest contents. A manifest is only updated in place if these match."""
+    return {
+        "phrase": config["phrase"],
+        "viseme_equivalent": bool(config["viseme_equivalent"]),
+        "start_date": config.get("start_date"),
+        "end_date": config.get("end_date"),
+        "timestamp_videos": bool(config.get("timestamp_videos", False)),
+        "query": bool(config.get("query", False)),
+        "fuzzy": config.get("fuzzy"),
+        "columns": MANIFEST_COLUMNS,
+    }
 
-            instances = get_instances(filename, config)
-            if len(instances) > 0:
-                num_videos += 1
-                pub_date = video_dates.get(video_id, "")
-                for instance in instances:
-                    manifest = pd.concat([
-                        manifest,
-                        pd.DataFrame([
-                            {
-                                "video_id": video_id,
-                                "title": title,
-                                "phrase": phrase,
-                                "timestamp": instance,
-                                "publish_date": pub_date
-                            }
-                        ])
-                    ], ignore_index=True)
-
-        print(f"Found {len(manifest)} clips in {num_videos} videos.")
-        print(f"Writing manifest to " + config["paths"]["manifest"])
 
+def load_manifest_index(config):
+    """Load the record of which transcript versions the manifest already covers."""
+    if os.path.exists(config["paths"]["manifest_index"]):
+        with open(config["paths"]["manifest_index"]) as f:
+            return json.load(f)
+    return None
+
+
+def save_manifest_index(config, transcripts):
+    with open(config["paths"]["manifest_index"], "w") as f:
+        json.dump({"settings": manifest_settings(config), "transcripts": transcripts}, f, indent=2)
+
+
+def transcript_version(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_transcript_index(config, path, normalize=None):
+    return transcript_index.load_index(path, normalize, on_warning=lambda message: report(config, message))
+
+
+def get_query_instances(filename, config, tree):
+    """Find matches of a parsed query in one transcript, with the text each match covers."""
+    index = load_transcript_index(config, config["paths"]["transcripts"]["tsv"] + filename + ".tsv", norm_txt)
+    if index is None:
+        return []
+
+    return [
+        {
+            "timestamp": index["starts"][first],
+            "end_timestamp": index["ends"][last],
+            "matched_text": " ".join(index["tokens"][first:last + 1])
+        }
+        for first, last in query.find_matches(tree, index)
+    ]
+
+
+def manifest_columns(config):
+    if config.get("query", False):
+        return MANIFEST_COLUMNS + ["matched_text"]
+    if config.get("fuzzy") is not None:
+        return MANIFEST_COLUMNS + ["matched_text", "similarity"]
+    return MANIFEST_COLUMNS
+
+
+def read_manifest_rows(config):
+    """Read the manifest as a list of row dicts."""
+    manifest = pd.read_csv(config["paths"]["manifest"], dtype=str, keep_default_na=False)
+    return manifest.to_dict("records")
+
+
+def make_result(config, row, status, clip_path=None, reason=None):
+    """
+    Structured result for one manifest row.
+    Status is "matched" for matches, and "done" or "failed" for clips.
+    """
+    return dict(row, channel=config["channel_name"], clip_path=clip_path, status=status, reason=reason)
+
+
+def get_fuzzy_instances(filename, config, matcher):
+    """Find fuzzy matches of the phrase in one transcript, with the text and similarity of each match."""
+    if config["viseme_equivalent"]:
+        path = config["paths"]["transcripts"]["vis"] + filename + ".tsv"
+        index = load_transcript_index(config, path)
+    else:
+        path = config["paths"]["transcripts"]["tsv"] + filename + ".tsv"
+        index = load_transcript_index(config, path, norm_txt)
+    if index is None:
+        return []
+
+    return [
+        {
+            "timestamp": index["starts"][first],
+            "end_timestamp": index["ends"][last],
+            "matched_text": " ".join(index["tokens"][first:last + 1]),
+            "similarity": round(similarity, 3)
+        }
+        for first, last, similarity in fuzzy.find_matches(matcher, index)
+    ]
+
+
+def iter_manifest(config):
+    """
+    Make or update the manifest of phrase instances, yielding each manifest row as a match result.
+    Transcripts already covered by an existing manifest are not rescanned: only new or
+    changed transcripts are searched, and rows from deleted or changed transcripts are dropped.
+    With write_manifest off, rows are yielded without writing the manifest to disk.
+    """
+    write_manifest = config.get("write_manifest", True)
+    if not (config['overwrite']['manifest'] or not os.path.exists(config["paths"]["manifest"])):
+        for row in read_manifest_rows(config):
+            yield make_result(config, row, "matched")
+        return
+
+    if config["viseme_equivalent"]:
+        transcript_dir = config["paths"]["transcripts"]["vis"]
+        phrase = visemes.txt_to_viseme(norm_txt(config["phrase"]))
+    else:
+        transcript_dir = config["paths"]["transcripts"]["tsv"]
+        phrase = norm_txt(config["phrase"])
+
+    tree = None
+    matcher = None
+    if config.get("query", False):
+        phrase = config["phrase"]
+        tree = query.parse(phrase, norm_txt)
+    elif config.get("fuzzy") is not None:
+        matcher = fuzzy.make_matcher(phrase, config["fuzzy"])
+    columns = manifest_columns(config)
+
+    # Get all transcript files and extract video info
+    all_files = []
+    for path in os.listdir(transcript_dir):
+        filename = path.replace(".tsv", "")
+        components = re.search(r'(.*)---(.*)', filename)
+        if components:
+            all_files.append({
+                'filename': filename,
+                'video_id': components.group(1),
+                'title': components.group(2),
+                'version': transcript_version(transcript_dir + path)
+            })
+
+    # Apply date filtering if specified, or fetch dates for timestamp overlay
+    start_date = parse_date_arg(config.get("start_date"))
+    end_date = parse_date_arg(config.get("end_date"))
+    need_dates = start_date or end_date or config.get("timestamp_videos", False)
+
+    if need_dates:
+        video_ids = [f['video_id'] for f in all_files]
+        video_dates = get_video_dates(config, video_ids)
+
+        if start_date or end_date:
+            filtered_ids = set(filter_videos_by_date(video_ids, video_dates, start_date, end_date))
+            all_files = [f for f in all_files if f['video_id'] in filtered_ids]
+            report(config, f"After date filtering: {len(all_files)} videos in range.")
+    else:
+        video_dates = {}
+
+    index = load_manifest_index(config)
+    incremental = (
+        not config.get("rebuild_manifest", False)
+        and os.path.exists(config["paths"]["manifest"])
+        and index is not None
+        and index["settings"] == manifest_settings(config)
+    )
+
+    if incremental:
+        covered = index["transcripts"]
+        current = {f['filename']: f for f in all_files}
+        stale_ids = {
+            re.search(r'(.*)---(.*)', filename).group(1)
+            for filename, version in covered.items()
+            if filename not in current or current[filename]['version'] != version
+        }
+        scan_files = [f for f in all_files if covered.get(f['filename']) != f['version']]
+
+        manifest = pd.read_csv(config["paths"]["manifest"], dtype=str, keep_default_na=False)
+        rescan_ids = stale_ids | {f['video_id'] for f in scan_files}
+        rows = manifest[~manifest["video_id"].isin(rescan_ids)].to_dict("records")
+        report(config, f"Updating manifest for phrase \"{config['phrase']}\": "
+                       f"{len(scan_files)} new or changed transcripts, {len(stale_ids)} stale videos dropped...")
+    else:
+        scan_files = all_files
+        rows = []
+        report(config, f"Making manifest for phrase \"{config['phrase']}\"...")
+
+    for row in rows:
+        yield make_result(config, row, "matched")
+
+    num_kept = len(rows)
+    num_found = 0
+    num_videos = 0
+    for file_info in scan_files:
+        if is_cancelled(config):
+            return
+
+        filename = file_info['filename']
+        video_id = file_info['video_id']
+        title = file_info['title']
+
+        if tree is not None:
+            instances = get_query_instances(filename, config, tree)
+        elif matcher is not None:
+            instances = get_fuzzy_instances(filename, config, matcher)
+        else:
+            instances = get_instances(filename, config)
+        if len(instances) > 0:
+            num_videos += 1
+            pub_date = video_dates.get(video_id, "")
+            for instance in instances:
+                row = {
+                    "video_id": video_id,
+                    "title": title,
+                    "phrase": phrase,
+                    "publish_date": pub_date,
+                    **instance
+                }
+                num_found += 1
+                if write_manifest:
+                    rows.append(row)
+                yield make_result(config, row, "matched")
+
+    report(config, f"Found {num_found} clips in {num_videos} videos. Manifest has {num_kept + num_found} clips.")
+
+    if write_manifest:
+        report(config, f"Writing manifest to " + config["paths"]["manifest"])
         if not os.path.exists(config["paths"]["manifest_root"]):
             os.makedirs(config["paths"]["manifest_root"])
-        manifest.to_csv(config["paths"]["manifest"], header=True, index=False)
+        pd.DataFrame(rows, columns=columns).to_csv(config["paths"]["manifest"], header=True, index=False)
+        save_manifest_index(config, {f['filename']: f['version'] for f in all_files})
+
+
+def make_manifest(config):
+    """Make or update the manifest and return its rows."""
+    return list(iter_manifest(config))
+
+
+def count_phrases(config):
+    """
+    Count matches of each analytics phrase in every transcript, with the same matcher
+    the manifest uses: plain phrases unless query is set.
+    Returns one row per (video, phrase), with the hours of content in the video
+    approximated by its last caption timestamp.
+    """
+    phrases = config["analytics_phrases"]
+    if config.get("query", False):
+        trees = {phrase: query.parse(phrase, norm_txt) for phrase in phrases}
+    transcript_dir = config["paths"]["transcripts"]["tsv"]
+
+    all_files = []
+    for path in os.listdir(transcript_dir):
+        components = re.search(r'(.*)---(.*)', path.replace(".tsv", ""))
+        if components:
+            all_files.append({'path': path, 'video_id': components.group(1), 'title': components.group(2)})
+
+    video_ids = [f['video_id'] for f in all_files]
+    start_date = parse_date_arg(config.get("start_date"))
+    end_date = parse_date_arg(config.get("end_date"))
+    if config["analytics"] == "month" or start_date or end_date:
+        video_dates = get_video_dates(config, video_ids)
+    else:
+        video_dates = load_video_dates_cache(config)
+    if start_date or end_date:
+        filtered_ids = set(filter_videos_by_date(video_ids, video_dates, start_date, end_date))
+        all_files = [f for f in all_files if f['video_id'] in filtered_ids]
+
+    report(config, f"Counting {len(phrases)} phrases in {len(all_files)} transcripts...")
+    rows = []
+    for file_info in all_files:
+        transcript = read_transcript_tsv(transcript_dir + file_info['path'], config)
+        if transcript is None or len(transcript) == 0:
+            continue
+        try:
+            hours = stamp_to_seconds(transcript["start"].iloc[-1]) / 3600
+        except ValueError:
+            hours = 0.0
+        if config.get("query", False):
+            index = transcript_index.build_index(transcript, norm_txt)
+
+        for phrase in phrases:
+            if config.get("query", False):
+                count = len(query.find_matches(trees[phrase], index))
+            else:
+                count = len(find_instances(transcript, norm_txt(phrase), config))
+            rows.append({
+                "video_id": file_info['video_id'],
+                "title": file_info['title'],
+                "publish_date": video_dates.get(file_info['video_id'], ""),
+                "hours": hours,
+                "phrase": phrase,
+                "count": count
+            })
+
+    return pd.DataFrame(rows, columns=analytics.COUNT_COLUMNS)
+
+
+def make_analytics(config):
+    counts = count_phrases(config)
+    table = analytics.aggregate(counts, config["analytics"])
+
+    output_dir = os.path.dirname(config["paths"]["analytics"])
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    analytics.write_table(table, config["paths"]["analytics"])
+
+    for phrase, phrase_counts in counts.groupby("phrase", sort=False):
+        hours = phrase_counts["hours"].sum()
+        rate = phrase_counts["count"].sum() / hours if hours else 0.0
+        report(config, f"\"{phrase}\": {phrase_counts['count'].sum()} matches in "
+              f"{(phrase_counts['count'] > 0).sum()} videos ({rate:.2f} per hour of content)")
+    report(config, f"Writing analytics to {config['paths']['analytics']}")
+
+
+def is_resuming(config):
+    return config.get("resume", False) and os.path.exists(config["paths"]["journal"])
+
+
+def get_clip_rows(config):
+    """
+    Rows to clip: the saved manifest when resuming, otherwise the manifest once it is made.
+    The manifest is written before any clip is made, so an interrupted run can be resumed.
+    """
+    if config.get("resume", False) and os.path.exists(config["paths"]["manifest"]):
+        return read_manifest_rows(config)
+    return make_manifest(config)
+
+
+def iter_clips(config, rows):
+    """
+    Make a clip for every manifest row, yielding a clip result as each one finishes.
+    Each row's progress is recorded in the job journal. With resume set, rows the
+    journal marks as done are skipped without touching the disk.
+    """
+    rows = list(enumerate(rows))
+    if config["max_files"]:
+        rows = rows[:config["max_files"]]
+
+    job = start_clip_job(config, rows)
+    for i, row in rows:
+        if is_cancelled(config):
+            return
+        yield clip_row(job, i, row)
+    finish_clip_job(job)
 
 
 def clip_all(config):
-    if config["overwrite"]["manifest"] or (not os.path.exists(f"{config['paths']['manifest']}{config['phrase']}.csv")):
-        make_manifest(config)
+    for _ in iter_clips(config, get_clip_rows(config)):
+        pass
 
-    manifest = pd.read_csv(config["paths"]["manifest"])
 
-    if config["max_files"] and (config["max_files"] < len(manifest)):
-        num_clips = config["max_files"]
+def start_clip_job(config, rows):
+    """Open the journal for a clip run and record every row as pending. Rows are then clipped with clip_row."""
+    journal_path = config["paths"]["journal"]
+    if is_resuming(config):
+        entries = journal.load_journal(journal_path)
+        report(config, f"Resuming from journal {journal_path}")
     else:
-        num_clips = len(manifest)
+        journal.reset_journal(journal_path)
+        entries = {}
+
+    job = {
+        "config": config,
+        "keys": {},
+        "entries": entries,
+        "clips": {},
+        # Rows of one job may be clipped from several threads
+        "lock": threading.Lock(),
+    }
+
+    pending = []
+    for i, row in rows:
+        key = journal.row_key(row["video_id"], row["timestamp"])
+        job["keys"][i] = key
+        if key not in entries:
+            pending.append({"key": key, "row": i, "status": "pending"})
+    journal.record(journal_path, pending)
+    for entry in pending:
+        entries[entry["key"]] = entry
+
+    return job
+
+
+def set_row_status(job, i, status, **fields):
+    entry = {"key": job["keys"][i], "row": i, "status": status, **fields}
+    with job["lock"]:
+        journal.record(job["config"]["paths"]["journal"], [entry])
+        job["entries"][job["keys"][i]] = entry
 
-    print(f"Creating {num_clips} clips...")
-    for i in range(num_clips):
-        try:
-            print(f"[{i+1}/{num_clips}] {manifest.loc[i, 'video_id']} - {manifest.loc[i, 'title'][:50]}...")
-            make_clip(
-                timestamp=manifest.loc[i, "timestamp"],
-                video_id=manifest.loc[i, "video_id"],
-                title=manifest.loc[i, "title"],
-                publish_date=manifest.loc[i, "publish_date"] if "publish_date" in manifest.columns else None,
-                config=config
-            )
-        except Exception as e:
-            print(f"Could not download manifest entry {i} (video_id {manifest.loc[i, 'video_id']})")
-            print(f"Exception: {str(e)}")
+
+def clip_row(job, i, row):
+    """Make the clip for manifest row i and return its clip result."""
+    config = job["config"]
+
+    with job["lock"]:
+        entry = job["entries"].get(job["keys"][i])
+    if entry["status"] == "done":
+        job["clips"][i] = {"path": entry["path"], "video_id": row["video_id"], "timestamp": row["timestamp"]}
+        return make_result(config, row, "done", clip_path=entry["path"])
+
+    try:
+        report(config, f"[{i+1}] {row['video_id']} - {row['title'][:50]}...")
+        clip_path = make_clip(
+            timestamp=row["timestamp"],
+            video_id=row["video_id"],
+            title=row["title"],
+            publish_date=row.get("publish_date") or None,
+            config=config,
+            on_status=lambda status: set_row_status(job, i, status),
+            end_timestamp=row.get("end_timestamp") or None
+        )
+        set_row_status(job, i, "done", path=clip_path)
+    except Exception as e:
+        set_row_status(job, i, "failed", reason=str(e))
+        report(config, f"Could not download manifest entry {i+1} (video_id {row['video_id']})")
+        report(config, f"Exception: {str(e)}")
+        return make_result(config, row, "failed", reason=str(e))
+
+    job["clips"][i] = {"path": clip_path, "video_id": row["video_id"], "timestamp": row["timestamp"]}
+    return make_result(config, row, "done", clip_path=clip_path)
+
+
+def finish_clip_job(job):
+    config = job["config"]
+    counts = journal.summarize({key: job["entries"][key] for key in job["keys"].values()})
+    report(config, f"Clips done: {counts['done']}, failed: {counts['failed']}. Journal: {config['paths']['journal']}")
+
+    if config.get("supercut", False):
+        make_supercut(config, [job["clips"][i] for i in sorted(job["clips"])])
+
+
+def make_supercut(config, clips):
+    """
+    Join clips into one montage with the concat demuxer, copying streams without re-encoding.
+    Clips are kept in manifest order unless supercut_order is "date".
+    """
+    if len(clips) == 0:
+        report(config, "No clips to join into a supercut.")
+        return
+
+    if config.get("supercut_order") == "date":
+        video_dates = get_video_dates(config, list({clip["video_id"] for clip in clips}))
+        clips = sorted(clips, key=lambda clip: (
+            video_dates.get(clip["video_id"], ""), clip["video_id"], clip["timestamp"]
+        ))
+
+    output_path = config["paths"]["supercut"]
+    output_dir = os.path.dirname(output_path)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    list_path = output_path[:-len(".mp4")] + ".txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for clip in clips:
+            clip_path = os.path.abspath(clip["path"]).replace("'", "'\\''")
+            f.write(f"file '{clip_path}'\n")
+
+    report(config, f"Joining {len(clips)} clips into supercut {output_path}")
+    cmd = [
+        'ffmpeg', '-y',
+        '-f', 'concat',
+        '-safe', '0',
+        '-i', list_path,
+        '-c', 'copy',
+        output_path
+    ]
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        stderr = result.stderr.decode() if result.stderr else ""
+        report(config, f"Could not create supercut: {stderr.strip().splitlines()[-1] if stderr.strip() else 'ffmpeg failed'}")
 
 
 def format_date_ordinal(date_str):
@@ -508,111 +1009,266 @@ def format_date_ordinal(date_str):
         return None
 
 
-def make_clip(timestamp, video_id, title, config, publish_date=None):
-
+def clip_window(timestamp, config, end_timestamp=None):
+    """
+    Start and end datetimes of the clip around a phrase instance.
+    With tight clips and a known end timestamp, the clip is cut around the matched words
+    with a small padding. Otherwise seconds_before and seconds_after pad the start timestamp.
+    """
     timestamp_dt = stamp_to_dt(timestamp)
+    end_timestamp_dt = stamp_to_dt(end_timestamp) if end_timestamp else None
+
+    if config.get("tight", False) and end_timestamp_dt and end_timestamp_dt > timestamp_dt:
+        padding = dt.timedelta(seconds=config["constants"]["TIGHT_PADDING_SECONDS"])
+        start_dt = timestamp_dt - padding
+        end_dt = end_timestamp_dt + padding
+    else:
+        start_dt = timestamp_dt - dt.timedelta(seconds=config["seconds_before"])
+        end_dt = timestamp_dt + dt.timedelta(seconds=config["seconds_after"])
+
+    # Clips cannot start before the video does
+    start_dt = max(start_dt, stamp_to_dt("00:00:00.000"))
+
+    return start_dt, end_dt
+
+
+def clip_filename(timestamp, video_id, title, config, end_timestamp=None):
+    start_dt, end_dt = clip_window(timestamp, config, end_timestamp)
+    return f"{video_id}---{title}---{start_dt.strftime('%H%M%S')}---{end_dt.strftime('%H%M%S')}.mp4"
+
+
+def clip_encode_options(config):
+    """
+    Get ffmpeg output options and video filters for clip encodes.
+    Preview clips are downscaled and encoded with a fast preset at a low bitrate.
+    Supercut clips are letterboxed to a fixed frame size, frame rate and audio
+    format so they can be concatenated without re-encoding.
+    """
+    constants = config["constants"]
+    options = {"c:v": "libx264", "c:a": "aac"}
+    filters = []
+
+    if config.get("preview", False):
+        options["preset"] = constants["PREVIEW_PRESET"]
+        options["b:v"] = constants["PREVIEW_VIDEO_BITRATE"]
+        options["b:a"] = constants["PREVIEW_AUDIO_BITRATE"]
+        height = constants["PREVIEW_HEIGHT"]
+    else:
+        height = constants["SUPERCUT_HEIGHT"]
+
+    if config.get("supercut", False):
+        width = height * 16 // 9
+        filters.append(
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease"
+            f",pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+            f",setsar=1"
+            f",fps={constants['SUPERCUT_FPS']}"
+        )
+        options["pix_fmt"] = "yuv420p"
+        options["ar"] = constants["SUPERCUT_AUDIO_RATE"]
+        options["ac"] = 2
+        options["video_track_timescale"] = 90000
+    elif config.get("preview", False):
+        filters.append(f"scale=-2:{height}")
+
+    return options, filters
+
+
+def filter_options(filters):
+    return {"vf": ",".join(filters)} if filters else {}
+
+
+def options_to_args(options):
+    args = []
+    for key, value in options.items():
+        args += [f"-{key}", str(value)]
+    return args
 
-    start_dt = timestamp_dt - dt.timedelta(seconds=config["seconds_before"])
-    end_dt = timestamp_dt + dt.timedelta(seconds=config["seconds_after"])
+
+class ClipError(Exception):
+    """Raised when a clip cannot be made from its source video."""
+
+
+def clip_failure_reason(stderr, video_id):
+    if "Error parsing OBU data" in stderr or "Invalid data found" in stderr:
+        return f"corrupted video: {video_id}"
+    lines = stderr.strip().splitlines()
+    return f"ffmpeg failed: {lines[-1] if lines else 'unknown error'}"
+
+
+def find_full_video(video_id, config):
+    # Ignore partial files left behind by interrupted yt-dlp downloads
+    return [
+        f for f in os.listdir(config['paths']['full_videos'])
+        if f.startswith(video_id) and not f.endswith((".part", ".ytdl")) and ".part-Frag" not in f
+    ]
+
+
+def make_clip(timestamp, video_id, title, config, publish_date=None, on_status=None, end_timestamp=None):
+    """
+    Make one clip and return its path.
+    Encodes go to a temporary file which is renamed into place once complete, so an
+    interrupted encode never leaves a clip that looks finished.
+    Raises ClipError if the clip cannot be made.
+    """
+
+    start_dt, end_dt = clip_window(timestamp, config, end_timestamp)
 
     diff_seconds = (end_dt - start_dt).total_seconds()
 
-    output_path = f"{config['paths']['clips']}/{video_id}---{title}---{start_dt.strftime('%H%M%S')}---{end_dt.strftime('%H%M%S')}.mp4"
+    output_path = f"{config['paths']['clips']}/{clip_filename(timestamp, video_id, title, config, end_timestamp)}"
+    temp_path = output_path[:-len(".mp4")] + ".part.mp4"
 
     if not os.path.exists(config['paths']['clips']):
         os.makedirs(config['paths']['clips'])
 
     # Skip if clip already exists (unless force_clips is set)
     if os.path.exists(output_path) and not config.get("force_clips", False):
-        return
+        return output_path
 
     if not os.path.exists(config['paths']['full_videos']):
         os.makedirs(config['paths']['full_videos'])
 
-    matching_input_files = [f for f in os.listdir(config['paths']['full_videos']) if f.startswith(video_id)]
+    matching_input_files = find_full_video(video_id, config)
     if len(matching_input_files) == 0:
+        if on_status:
+            on_status("downloading")
         download_video(video_id, config)
-        matching_input_files = [f for f in os.listdir(config['paths']['full_videos']) if f.startswith(video_id)]
+        matching_input_files = find_full_video(video_id, config)
 
-    if len(matching_input_files) > 0:
-        input_path = f"{config['paths']['full_videos'] + matching_input_files[0]}"
+    if len(matching_input_files) == 0:
+        raise ClipError("No matching input files!")
+
+    if on_status:
+        on_status("encoding")
+
+    input_path = f"{config['paths']['full_videos'] + matching_input_files[0]}"
+
+    input_stream = ffmpeg.input(input_path, ss=dt_to_stamp(start_dt), t=diff_seconds)
+    options, filters = clip_encode_options(config)
+
+    cmd = None
+    # Add timestamp overlay if requested
+    if config.get("timestamp_videos", False) and publish_date:
+        formatted_date = format_date_ordinal(publish_date)
+        if formatted_date:
+            # Build ffmpeg command directly for proper font handling on Windows
+            font_file = "C:/Windows/Fonts/pala.ttf"  # Palatino Linotype - elegant serif
+            drawtext_filter = (
+                f"drawtext=text='{formatted_date}'"
+                f":fontfile='{font_file}'"
+                f":fontsize=156"
+                f":fontcolor=white"
+                f":borderw=4"
+                f":bordercolor=black"
+                f":shadowcolor=black@0.6"
+                f":shadowx=4"
+                f":shadowy=4"
+                f":x=w-tw-50"
+                f":y=40"
+            )
+            cmd = [
+                'ffmpeg', '-y',
+                '-ss', dt_to_stamp(start_dt),
+                '-i', input_path,
+                '-t', str(diff_seconds),
+                '-vf', ",".join([drawtext_filter] + filters),
+                *options_to_args(options),
+                '-f', 'mp4',
+                temp_path
+            ]
+
+    if cmd is None:
+        cmd = (input_stream
+            .output(temp_path, f='mp4', **options, **filter_options(filters))
+            .overwrite_output()
+            .compile()
+        )
 
-        input_stream = ffmpeg.input(input_path, ss=dt_to_stamp(start_dt), t=diff_seconds)
-        
-        # Add timestamp overlay if requested
-        if config.get("timestamp_videos", False) and publish_date:
-            formatted_date = format_date_ordinal(publish_date)
-            if formatted_date:
-                # Build ffmpeg command directly for proper font handling on Windows
-                import subprocess
-                font_file = "C:/Windows/Fonts/pala.ttf"  # Palatino Linotype - elegant serif
-                drawtext_filter = (
-                    f"drawtext=text='{formatted_date}'"
-                    f":fontfile='{font_file}'"
-                    f":fontsize=156"
-                    f":fontcolor=white"
-                    f":borderw=4"
-                    f":bordercolor=black"
-                    f":shadowcolor=black@0.6"
-                    f":shadowx=4"
-                    f":shadowy=4"
-                    f":x=w-tw-50"
-                    f":y=40"
-                )
-                cmd = [
-                    'ffmpeg', '-y',
-                    '-ss', dt_to_stamp(start_dt),
-                    '-i', input_path,
-                    '-t', str(diff_seconds),
-                    '-vf', drawtext_filter,
-                    '-c:v', 'libx264',
-                    '-c:a', 'aac',
-                    output_path
-                ]
-                result = subprocess.run(cmd, capture_output=True, timeout=int(diff_seconds) * 10 + 30)
-                if result.returncode != 0:
-                    stderr = result.stderr.decode() if result.stderr else ""
-                    if "Error parsing OBU data" in stderr or "Invalid data found" in stderr:
-                        print(f"Skipping clip due to corrupted video: {video_id}")
-                        if os.path.exists(output_path):
-                            os.remove(output_path)
-                return
-            else:
-                process = (input_stream
-                    .output(output_path, f='mp4', vcodec='libx264')
-                    .overwrite_output()
-                )
+    # Timeout: clip duration * 10 (for slow encodes) + 30 seconds buffer
+    timeout_seconds = int(diff_seconds) * 10 + 30
+
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=timeout_seconds
+        )
+    except subprocess.TimeoutExpired:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise ClipError(f"timeout encoding clip from {video_id} (likely corrupted)")
+
+    if result.returncode != 0:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        stderr = result.stderr.decode(errors="ignore") if result.stderr else ""
+        raise ClipError(clip_failure_reason(stderr, video_id))
+
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+def find_manifest_row(manifest, selection, config):
+    """
+    Resolve an upgrade selection to a manifest row index.
+    Selections are either row numbers, counted from 1 as in clip progress messages,
+    or clip filenames.
+    """
+    selection = str(selection)
+    if selection.isdigit():
+        row = int(selection) - 1
+        if 0 <= row < len(manifest):
+            return row
+        return None
+
+    filename = os.path.basename(selection)
+    for i, row in enumerate(manifest):
+        name = clip_filename(
+            row["timestamp"], row["video_id"], row["title"], config, row.get("end_timestamp") or None
+        )
+        if name == filename:
+            return i
+    return None
+
+
+def iter_upgrade(config, selections):
+    """Re-encode the selected preview clips at full quality, yielding a clip result for each."""
+    manifest = read_manifest_rows(config)
+
+    rows = []
+    for selection in selections:
+        row = find_manifest_row(manifest, selection, config)
+        if row is None:
+            report(config, f"No manifest entry matches {selection}")
         else:
-            process = (input_stream
-                .output(output_path, f='mp4', vcodec='libx264')
-                .overwrite_output()
-            )
+            rows.append(row)
 
-        # Timeout: clip duration * 10 (for slow encodes) + 30 seconds buffer
-        timeout_seconds = int(diff_seconds) * 10 + 30
-        
+    report(config, f"Upgrading {len(rows)} clips to full quality...")
+    for n, i in enumerate(rows):
+        if is_cancelled(config):
+            return
+        row = manifest[i]
         try:
-            import subprocess
-            cmd = process.compile()
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                timeout=timeout_seconds
+            report(config, f"[{i+1}] ({n+1}/{len(rows)}) {row['video_id']} - {row['title'][:50]}...")
+            clip_path = make_clip(
+                timestamp=row["timestamp"],
+                video_id=row["video_id"],
+                title=row["title"],
+                publish_date=row.get("publish_date") or None,
+                config=config,
+                end_timestamp=row.get("end_timestamp") or None
             )
-            if result.returncode != 0:
-                stderr = result.stderr.decode() if result.stderr else ""
-                if "Error parsing OBU data" in stderr or "Invalid data found" in stderr:
-                    print(f"Skipping clip due to corrupted video: {video_id}")
-                    if os.path.exists(output_path):
-                        os.remove(output_path)
-                    return
-        except subprocess.TimeoutExpired:
-            print(f"Timeout encoding clip from {video_id} - skipping (likely corrupted)")
-            if os.path.exists(output_path):
-                os.remove(output_path)
-            return
-    else:
-        print("No matching input files!")
+            yield make_result(config, row, "done", clip_path=clip_path)
+        except Exception as e:
+            report(config, f"Could not upgrade manifest entry {i+1} (video_id {row['video_id']})")
+            report(config, f"Exception: {str(e)}")
+            yield make_result(config, row, "failed", reason=str(e))
+
+
+def upgrade_clips(config, selections):
+    for _ in iter_upgrade(config, selections):
+        pass
 
 
 def get_video_release_date(video_id):
@@ -646,24 +1302,246 @@ def make_vis_tsvs(config):
         transcript.to_csv(config['paths']['transcripts']['vis'] + f_out, sep="\t", header=True, index=False)
 
 
-def run(config):
+def prepare_transcripts(config):
     if config["download_subs"] or ((not config["skip_manifest"]) and (not os.path.exists(config["paths"]["transcripts"]["tsv"]))):
-        print("Transcripts do not exist. Downloading channel subs...")
+        report(config, "Transcripts do not exist. Downloading channel subs...")
         download_channel_subs(config)
+    elif config["overwrite"]["tsv"]:
+        report(config, "Rebuilding transcripts with word-level timings...")
+        convert_all_subs_to_tsv(config)
 
-    if config["viseme_equivalent"] and (not os.path.exists(config["paths"]["transcripts"]["vis"])):
+    if config["viseme_equivalent"] and (config["overwrite"]["vis"] or not os.path.exists(config["paths"]["transcripts"]["vis"])):
         make_vis_tsvs(config)
 
+
+def iter_run(config):
+    """
+    Run phrase_getter on one channel, yielding results as they are produced.
+    Yields a match result per manifest row, or a clip result per clip unless skip_download is set.
+    """
+    if config.get("upgrade"):
+        yield from iter_upgrade(config, config["upgrade"])
+        return
+
+    if config.get("analytics"):
+        if config["download_subs"] or not os.path.exists(config["paths"]["transcripts"]["tsv"]):
+            download_channel_subs(config)
+        make_analytics(config)
+        return
+
+    prepare_transcripts(config)
+    if is_cancelled(config):
+        return
+
+    if config["skip_download"]:
+        yield from iter_manifest(config)
+        return
+
+    rows = get_clip_rows(config)
+    if is_cancelled(config):
+        return
+    yield from iter_clips(config, rows)
+
+
+def run(config):
+    for _ in iter_run(config):
+        pass
+
+
+def read_channel_group(path):
+    """Read channel names from a channel-group file, one per line. Lines starting with # are ignored."""
+    with open(path) as f:
+        lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def get_channel_names(args):
+    channel_names = args.get("channel_name") or []
+    if isinstance(channel_names, str):
+        channel_names = [channel_names]
+    channel_names = list(channel_names)
+    if args.get("channel_group"):
+        channel_names += read_channel_group(args["channel_group"])
+
+    # Keep the first occurrence of each channel
+    return list(dict.fromkeys(channel_names))
+
+
+def prepare_channel(config):
+    """Sync a channel's transcripts and return its manifest rows."""
+    prepare_transcripts(config)
     if config["skip_download"]:
-        make_manifest(config)
+        return make_manifest(config)
+    return get_clip_rows(config)
+
+
+def write_combined_manifest(configs, manifests, output_directory):
+    """Combine the manifest rows of several channels into one manifest with a channel column."""
+    columns = ["channel"] + manifest_columns(configs[0])
+    frames = [
+        pd.DataFrame([dict(row, channel=config["channel_name"]) for row in rows], columns=columns)
+        for config, rows in zip(configs, manifests)
+        if len(rows) > 0
+    ]
+    if len(frames) == 0:
+        return
+
+    combined_root = output_directory + "manifests/"
+    if not os.path.exists(combined_root):
+        os.makedirs(combined_root)
+    combined_path = combined_root + os.path.basename(configs[0]["paths"]["manifest"])
+    combined = pd.concat(frames, ignore_index=True)
+    report(configs[0], f"Writing combined manifest of {len(combined)} clips from {len(frames)} channels to {combined_path}")
+    combined.to_csv(combined_path, header=True, index=False)
+
+
+def iter_channels(args, channel_names):
+    """
+    Run one phrase across several channels concurrently, yielding results as they are produced.
+    Subtitle syncing, matching and clipping for every channel share one pool of workers.
+    Each channel starts clipping as soon as its manifest is ready, and clips from the same
+    video are made by one worker so each video is downloaded once. Closing the iterator
+    stops the run.
+    """
+    workers = args.get("workers") or 1
+    # Set when the run ends or the iterator is closed, so workers stop taking on new work
+    stop = threading.Event()
+    configs = [make_config(dict(args, channel_name=channel_name, stop=stop)) for channel_name in channel_names]
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    submitted = []
+
+    def submit(fn, *fn_args):
+        future = pool.submit(fn, *fn_args)
+        submitted.append(future)
+        return future
+
+    try:
+        if args.get("analytics"):
+            futures = [submit(lambda config: list(iter_run(config)), config) for config in configs]
+            for future in as_completed(futures):
+                yield from future.result()
+            return
+
+        # Workers report prepared channels, finished clips and finished videos through one queue,
+        # so clips of ready channels start and are yielded while other channels are still syncing
+        messages = queue.Queue()
+
+        def prepare(n):
+            try:
+                messages.put(("prepared", n, prepare_channel(configs[n])))
+            except Exception as e:
+                report(configs[n], f"Could not search channel {configs[n]['channel_name']}")
+                report(configs[n], f"Exception: {str(e)}")
+                messages.put(("prepared", n, None))
+
+        def clip_rows(n, job, rows):
+            try:
+                for i, row in rows:
+                    if is_cancelled(job["config"]):
+                        break
+                    messages.put(("clip", n, clip_row(job, i, row)))
+            finally:
+                messages.put(("video_done", n, None))
+
+        for n in range(len(configs)):
+            submit(prepare, n)
+
+        manifests = {}
+        jobs = {}
+        videos_left = {}
+        num_prepared = 0
+        running = len(configs)
+        while running > 0:
+            kind, n, value = messages.get()
+            config = configs[n]
+
+            if kind == "clip":
+                yield value
+                continue
+
+            running -= 1
+            if kind == "video_done":
+                videos_left[n] -= 1
+                if videos_left[n] == 0:
+                    report(config, f"{config['channel_name']}:")
+                    finish_clip_job(jobs[n])
+                continue
+
+            num_prepared += 1
+            if value is not None:
+                manifests[n] = value
+            if num_prepared == len(configs) and args.get("write_manifest", True):
+                ready = [n for n in range(len(configs)) if n in manifests]
+                if len(ready) > 0:
+                    write_combined_manifest(
+                        [configs[n] for n in ready], [manifests[n] for n in ready], args["output_directory"]
+                    )
+
+            if value is None or is_cancelled(config):
+                continue
+            if args["skip_download"]:
+                for row in value:
+                    yield make_result(config, row, "matched")
+                continue
+
+            rows = list(enumerate(value))
+            if config["max_files"]:
+                rows = rows[:config["max_files"]]
+            jobs[n] = start_clip_job(config, rows)
+
+            rows_by_video = {}
+            for i, row in rows:
+                rows_by_video.setdefault(row["video_id"], []).append((i, row))
+            videos_left[n] = len(rows_by_video)
+            if len(rows_by_video) == 0:
+                finish_clip_job(jobs[n])
+            for video_rows in rows_by_video.values():
+                submit(clip_rows, n, jobs[n], video_rows)
+                running += 1
+
+    finally:
+        # Drop queued work; running workers finish the clip they are on
+        stop.set()
+        for future in submitted:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def iter_all(args):
+    """Run a phrase on one channel, or concurrently across several channels, yielding results."""
+    channel_names = get_channel_names(args)
+    if len(channel_names) == 0:
+        raise ValueError("No channels given. Pass channel names or a channel-group file.")
+    if args.get("upgrade") and len(channel_names) > 1:
+        raise ValueError("Upgrade selections refer to one channel's manifest. Upgrade one channel at a time.")
+
+    if len(channel_names) == 1:
+        yield from iter_run(make_config(dict(args, channel_name=channel_names[0])))
     else:
-        clip_all(config)
+        yield from iter_channels(args, channel_names)
 
-def get(
+
+def iter_get(
     phrase, channel_name, output_directory=os.getcwd(), skip_download=False, max_files=None,
     seconds_before=1, seconds_after=5, skip_manifest=False, download_subs=False, viseme_equivalent=False,
-    start_date=None, end_date=None, force_clips=False, timestamp_videos=False
+    start_date=None, end_date=None, force_clips=False, timestamp_videos=False, preview=False, upgrade=None,
+    supercut=False, supercut_order="manifest", resume=False, rebuild_manifest=False, query=False,
+    analytics=None, analytics_phrase=None, analytics_format="csv", channel_group=None, workers=4,
+    tight=False, rebuild_transcripts=False, fuzzy=None, progress=None, cancel=None, write_manifest=True
 ):
+    """
+    Find and clip a phrase, yielding a result dict for each match or clip as it is produced.
+
+    Results hold the manifest row (video_id, title, phrase, timestamp, end_timestamp,
+    publish_date) along with channel, clip_path, status and reason. Status is "matched"
+    when skip_download is set, otherwise "done" or "failed" for each clip.
+
+    progress is called with each progress message instead of printing it. cancel is an
+    object with an is_set() method, such as threading.Event; once it is set, no new work
+    is started. Closing the iterator also stops the run. With write_manifest off, matches
+    are streamed without writing the manifest CSV.
+    """
     args = {
         'phrase': phrase,
         'channel_name': channel_name,
@@ -678,9 +1556,50 @@ def get(
         'start_date': start_date,
         'end_date': end_date,
         'force_clips': force_clips,
-        'timestamp_videos': timestamp_videos
+        'timestamp_videos': timestamp_videos,
+        'preview': preview,
+        'upgrade': upgrade,
+        'supercut': supercut,
+        'supercut_order': supercut_order,
+        'resume': resume,
+        'rebuild_manifest': rebuild_manifest,
+        'query': query,
+        'analytics': analytics,
+        'analytics_phrase': analytics_phrase,
+        'analytics_format': analytics_format,
+        'channel_group': channel_group,
+        'workers': workers,
+        'tight': tight,
+        'rebuild_transcripts': rebuild_transcripts,
+        'fuzzy': fuzzy,
+        'progress': progress,
+        'cancel': cancel,
+        'write_manifest': write_manifest
     }
-    run(make_config(args))
+    yield from iter_all(args)
+
+
+def get(
+    phrase, channel_name, output_directory=os.getcwd(), skip_download=False, max_files=None,
+    seconds_before=1, seconds_after=5, skip_manifest=False, download_subs=False, viseme_equivalent=False,
+    start_date=None, end_date=None, force_clips=False, timestamp_videos=False, preview=False, upgrade=None,
+    supercut=False, supercut_order="manifest", resume=False, rebuild_manifest=False, query=False,
+    analytics=None, analytics_phrase=None, analytics_format="csv", channel_group=None, workers=4,
+    tight=False, rebuild_transcripts=False, fuzzy=None, progress=None, cancel=None
+):
+    """Find and clip a phrase, writing manifests and clips to disk. Arguments are as for iter_get."""
+    results = iter_get(
+        phrase, channel_name, output_directory=output_directory, skip_download=skip_download,
+        max_files=max_files, seconds_before=seconds_before, seconds_after=seconds_after,
+        skip_manifest=skip_manifest, download_subs=download_subs, viseme_equivalent=viseme_equivalent,
+        start_date=start_date, end_date=end_date, force_clips=force_clips, timestamp_videos=timestamp_videos,
+        preview=preview, upgrade=upgrade, supercut=supercut, supercut_order=supercut_order, resume=resume,
+        rebuild_manifest=rebuild_manifest, query=query, analytics=analytics, analytics_phrase=analytics_phrase,
+        analytics_format=analytics_format, channel_group=channel_group, workers=workers, tight=tight,
+        rebuild_transcripts=rebuild_transcripts, fuzzy=fuzzy, progress=progress, cancel=cancel
+    )
+    for _ in results:
+        pass
 
 
 def parse_args():
@@ -689,7 +1608,10 @@ def parse_args():
     )
 
     parser.add_argument("phrase", type=str, help="Phrase to find clips of")
-    parser.add_argument("channel_name", type=str, help="Youtube channel name")
+    parser.add_argument(
+        "channel_name", type=str, nargs="*",
+        help="Youtube channel name. Give several names to search them concurrently."
+    )
     parser.add_argument(
         "--output_directory", "-o", type=str, default=os.getcwd(),
         help="Directory for outputting intermediate files, full downloaded videos and clips."
@@ -704,10 +1626,23 @@ def parse_args():
                         help="Number of seconds before phrase instance to start each clip")
     parser.add_argument("--seconds-after", type=int, default=5,
                         help="Number of seconds after phrase instance to end each clip")
+    parser.add_argument(
+        "--tight", action="store_true",
+        help="Cut clips tightly around the matched words using word-level timings. "
+             "Falls back to --seconds-before and --seconds-after where timings are unavailable."
+    )
+    parser.add_argument(
+        "--rebuild-transcripts", action="store_true",
+        help="Regenerate transcript tables from downloaded subtitles, e.g. to add word-level timings."
+    )
     parser.add_argument(
         "--skip-manifest", action="store_true",
         help="Use this flag to skip manifest creation step if manifest already exists for that phrase."
     )
+    parser.add_argument(
+        "--rebuild-manifest", action="store_true",
+        help="Rescan every transcript instead of only new or changed ones when updating the manifest."
+    )
     parser.add_argument(
         "--download-subs", action="store_true",
         help="Use this flag to redownload all subtitles even if they already exist in the output directory."
@@ -716,6 +1651,37 @@ def parse_args():
         "--viseme-equivalent", action="store_true",
         help="Use this flag to search for clips which are lip-reading equivalent to the provided phrase."
     )
+    parser.add_argument(
+        "--fuzzy", type=int, default=None, metavar="MAX_EDITS",
+        help="Also match mis-transcribed phrases up to MAX_EDITS character edits from the phrase. "
+             "Combine with --viseme-equivalent to compare lip-reading transcriptions."
+    )
+    parser.add_argument(
+        "--query", action="store_true",
+        help="Treat the phrase as a query: '*' matches any word, 'theor*' matches a prefix, "
+             "'a OR b' matches alternatives and 'a NEAR/3 b' matches words at most 3 words apart."
+    )
+    parser.add_argument(
+        "--analytics", type=str, choices=["month", "video"], default=None,
+        help="Count the phrase per publish month or per video, with rates per hour of content, "
+             "instead of making clips. No videos are downloaded."
+    )
+    parser.add_argument(
+        "--analytics-phrase", type=str, action="append", default=None,
+        help="Another phrase to include in analytics. Can be used more than once."
+    )
+    parser.add_argument(
+        "--analytics-format", type=str, choices=["csv", "json"], default="csv",
+        help="Output format for analytics tables."
+    )
+    parser.add_argument(
+        "--channel-group", type=str, default=None,
+        help="File listing Youtube channel names to search, one per line."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4,
+        help="Number of workers shared by all channels when searching several channels."
+    )
     parser.add_argument(
         "--start-date", type=str, default=None,
         help="Only include videos published on or after this date (format: YYYY-MM-DD)"
@@ -732,6 +1698,27 @@ def parse_args():
         "--timestamp-videos", action="store_true",
         help="Add publish date overlay (e.g., 'January 24th, 2026') to top-right of clips."
     )
+    parser.add_argument(
+        "--preview", action="store_true",
+        help="Quickly encode low-resolution preview clips into the clips_preview folder."
+    )
+    parser.add_argument(
+        "--upgrade", type=str, nargs="+", default=None, metavar="ROW_OR_FILENAME",
+        help="Re-encode the selected clips at full quality. Select clips by manifest row, counted from 1 "
+             "as in the clip progress messages, or by clip filename. Only one channel can be upgraded at a time."
+    )
+    parser.add_argument(
+        "--supercut", action="store_true",
+        help="Encode all clips with identical settings and join them into one montage in the supercuts folder."
+    )
+    parser.add_argument(
+        "--supercut-order", type=str, choices=["manifest", "date"], default="manifest",
+        help="Order supercut clips by manifest order (default) or by video publish date."
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Continue an interrupted clip run from its journal, reusing the existing manifest."
+    )
 
     args = parser.parse_args()
     return args
@@ -740,5 +1727,5 @@ def parse_args():
 if __name__ == '__main__':
 
     args = parse_args()
-    config = make_config(args)
-    run(config)
+    for _ in iter_all(vars(args)):
+        pass
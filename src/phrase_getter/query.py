@@ -0,0 +1,182 @@
+"""
+Small query language over positional transcript indexes.
+
+    game theory              words in sequence
+    game * theory            * matches any single word
+    theor*                   prefix term
+    game theory OR theory of games
+    game NEAR/3 theory       at most 3 words between the two sides, in either order
+    (game OR games) theory   parentheses group alternatives
+
+OR binds loosest, then NEAR/k, then word sequences.
+"""
+import re
+import bisect
+import hashlib
+
+import transcript_index
+
+NEAR_PATTERN = re.compile(r'^NEAR/(\d+)$')
+
+
+def is_query_operator(token):
+    return token == "OR" or NEAR_PATTERN.match(token) is not None or token in ("(", ")")
+
+
+def parse(text, normalize):
+    """
+    Parse a query string into a tree of tuples.
+    Words are passed through normalize so they match normalized transcript tokens.
+    Raises ValueError on malformed queries.
+    """
+    tokens = text.replace("(", " ( ").replace(")", " ) ").split()
+    tree, i = _parse_or(tokens, 0, normalize)
+    if i != len(tokens):
+        raise ValueError(f"Unexpected \"{tokens[i]}\" in query: {text}")
+    return tree
+
+
+def _parse_or(tokens, i, normalize):
+    options = []
+    node, i = _parse_near(tokens, i, normalize)
+    options.append(node)
+    while i < len(tokens) and tokens[i] == "OR":
+        node, i = _parse_near(tokens, i + 1, normalize)
+        options.append(node)
+    if len(options) == 1:
+        return options[0], i
+    return ("or", options), i
+
+
+def _parse_near(tokens, i, normalize):
+    left, i = _parse_seq(tokens, i, normalize)
+    while i < len(tokens) and NEAR_PATTERN.match(tokens[i]):
+        distance = int(NEAR_PATTERN.match(tokens[i]).group(1))
+        right, i = _parse_seq(tokens, i + 1, normalize)
+        left = ("near", distance, left, right)
+    return left, i
+
+
+def _parse_seq(tokens, i, normalize):
+    items = []
+    while i < len(tokens) and (tokens[i] == "(" or not is_query_operator(tokens[i])):
+        if tokens[i] == "(":
+            node, i = _parse_or(tokens, i + 1, normalize)
+            if i >= len(tokens) or tokens[i] != ")":
+                raise ValueError("Unclosed parenthesis in query")
+            items.append(node)
+            i += 1
+        elif tokens[i] == "*":
+            items.append(("any",))
+            i += 1
+        elif tokens[i].endswith("*"):
+            prefix = normalize(tokens[i][:-1])
+            if not prefix:
+                raise ValueError(f"Empty prefix term in query: {tokens[i]}")
+            items.append(("prefix", prefix))
+            i += 1
+        else:
+            word = normalize(tokens[i])
+            if not word:
+                raise ValueError(f"Query term has no searchable characters: {tokens[i]}")
+            items.append(("word", word))
+            i += 1
+
+    if len(items) == 0:
+        raise ValueError("Expected a search term in query")
+    if all(item[0] == "any" for item in items):
+        raise ValueError("A query cannot consist only of wildcards")
+    if len(items) == 1:
+        return items[0], i
+    return ("seq", items), i
+
+
+def evaluate(tree, index):
+    """Return the set of (first, last) token positions matching the query tree."""
+    kind = tree[0]
+    if kind == "word":
+        return {(p, p) for p in transcript_index.word_positions(index, tree[1])}
+    if kind == "prefix":
+        return {(p, p) for p in transcript_index.prefix_positions(index, tree[1])}
+    if kind == "any":
+        return {(p, p) for p in range(len(index["tokens"]))}
+    if kind == "or":
+        spans = set()
+        for option in tree[1]:
+            spans |= evaluate(option, index)
+        return spans
+    if kind == "seq":
+        return _evaluate_seq(tree[1], index)
+    if kind == "near":
+        return _evaluate_near(tree[1], evaluate(tree[2], index), evaluate(tree[3], index))
+    raise ValueError(f"Unknown query node: {kind}")
+
+
+def _evaluate_seq(items, index):
+    num_tokens = len(index["tokens"])
+    spans = None
+    for item in items:
+        if item[0] == "any":
+            if spans is None:
+                spans = {(p, p) for p in range(num_tokens)}
+            else:
+                spans = {(first, last + 1) for first, last in spans if last + 1 < num_tokens}
+            continue
+
+        item_spans = evaluate(item, index)
+        if spans is None:
+            spans = item_spans
+            continue
+
+        ends_by_start = {}
+        for first, last in item_spans:
+            ends_by_start.setdefault(first, []).append(last)
+        spans = {
+            (first, item_last)
+            for first, last in spans
+            for item_last in ends_by_start.get(last + 1, [])
+        }
+        if not spans:
+            break
+    return spans
+
+
+def _evaluate_near(distance, left, right):
+    by_start = sorted(right)
+    starts = [first for first, last in by_start]
+    by_end = sorted(right, key=lambda span: span[1])
+    ends = [last for first, last in by_end]
+
+    spans = set()
+    for first, last in left:
+        # right side after the left side
+        lo = bisect.bisect_left(starts, last + 1)
+        hi = bisect.bisect_right(starts, last + 1 + distance)
+        for r_first, r_last in by_start[lo:hi]:
+            spans.add((first, r_last))
+        # right side before the left side
+        lo = bisect.bisect_left(ends, first - 1 - distance)
+        hi = bisect.bisect_right(ends, first - 1)
+        for r_first, r_last in by_end[lo:hi]:
+            spans.add((r_first, last))
+    return spans
+
+
+def find_matches(tree, index):
+    """
+    Matches of a query in one transcript as (first, last) token positions in order.
+    The shortest match at each position is kept and matches overlapping it are dropped.
+    """
+    matches = []
+    for first, last in sorted(evaluate(tree, index)):
+        if matches and first <= matches[-1][1]:
+            continue
+        matches.append((first, last))
+    return matches
+
+
+def slug(text):
+    """File-system friendly name for a query, unique per query string."""
+    digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:8]
+    words = re.sub(r'[^a-zA-Z0-9]+', ' ', text).lower().split()
+    return f"{' '.join(words)}_query_{digest}"
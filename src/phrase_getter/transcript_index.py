@@ -0,0 +1,121 @@
+"""
+Positional token representation of TSV transcripts.
+
+Every word of a transcript keeps its position in the video and its start time,
+taken from the word-level timings where the transcript has them and from the
+start of its row otherwise. An inverted index maps each word to its positions,
+so a search only visits the places where its words actually occur.
+"""
+import bisect
+
+import pandas as pd
+
+
+def read_transcript(path):
+    return pd.read_csv(
+        path, sep="\t",
+        keep_default_na=False,
+        on_bad_lines='skip',
+        quoting=3  # QUOTE_NONE - ignore quote characters
+    )
+
+
+def has_word_times(text, word_times=""):
+    """True if a transcript row has a word-level timing for each of its words."""
+    return len(str(word_times).split()) == len(str(text).split())
+
+
+def row_word_times(text, start, word_times=""):
+    """
+    Pair each word of a transcript row with its start time.
+    Rows without matching word-level timings fall back to the row start for every word.
+    """
+    words = str(text).split()
+    times = str(word_times).split()
+    if not has_word_times(text, word_times):
+        times = [start] * len(words)
+    return list(zip(words, times))
+
+
+def tokenize(transcript, normalize=None):
+    """
+    Split transcript rows into words with their start and end times.
+    A word ends when the next word with a later start time begins. The last word ends
+    at the end of its row, where the transcript records one. Words of rows without
+    word-level timings only have their row start, so their end is left empty.
+    """
+    num_rows = len(transcript)
+    word_times = transcript["word_times"] if "word_times" in transcript.columns else [""] * num_rows
+    row_ends = transcript["end"] if "end" in transcript.columns else [""] * num_rows
+
+    tokens = []
+    starts = []
+    timed = []
+    last_end = ""
+    for start, text, times, row_end in zip(transcript["start"], transcript["text"], word_times, row_ends):
+        row_timed = has_word_times(text, times)
+        for word, time in row_word_times(text, start, times):
+            if normalize:
+                word = normalize(word)
+            if word:
+                tokens.append(word)
+                starts.append(time)
+                timed.append(row_timed)
+                last_end = row_end
+
+    ends = [""] * len(tokens)
+    for i in reversed(range(len(tokens))):
+        if not timed[i]:
+            continue
+        if i + 1 == len(tokens):
+            ends[i] = last_end
+        elif starts[i + 1] != starts[i]:
+            ends[i] = starts[i + 1]
+        else:
+            ends[i] = ends[i + 1]
+    return {"tokens": tokens, "starts": starts, "ends": ends}
+
+
+def build_positions(tokens):
+    positions = {}
+    for i, token in enumerate(tokens):
+        positions.setdefault(token, []).append(i)
+    return positions
+
+
+def load_index(path, normalize=None, on_warning=print):
+    """
+    Load a transcript as a positional index.
+    Returns a dict with tokens, their start times, the word -> positions index and the
+    sorted vocabulary, or None if the transcript cannot be parsed.
+    on_warning is called with a message for transcripts that cannot be parsed.
+    """
+    try:
+        transcript = read_transcript(path)
+    except Exception as e:
+        on_warning(f"Warning: Could not parse {path}: {e}")
+        return None
+    return build_index(transcript, normalize)
+
+
+def build_index(transcript, normalize=None):
+    """Positional index of a transcript already read with read_transcript."""
+    index = tokenize(transcript, normalize)
+    index["positions"] = build_positions(index["tokens"])
+    index["vocabulary"] = sorted(index["positions"])
+    return index
+
+
+def word_positions(index, word):
+    return index["positions"].get(word, [])
+
+
+def prefix_positions(index, prefix):
+    """Positions of every word starting with prefix, in order."""
+    vocabulary = index["vocabulary"]
+    positions = []
+    i = bisect.bisect_left(vocabulary, prefix)
+    while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+        positions += index["positions"][vocabulary[i]]
+        i += 1
+    return sorted(positions)
@@ -28,20 +28,50 @@ def get_timebound_in_line(line):
     else:
         return timestamps[0]
 
+def get_word_times_in_line(line, line_start):
+    """
+    Get the start time of each word in a line with inline <00:00:01.234> word timing tags.
+    Words before the first tag start at line_start.
+    """
+    word_times = []
+    time = line_start
+    segments = re.split(r'<(' + TIME_FORMAT + r')>', line)
+    for i, segment in enumerate(segments):
+        if i % 2 == 1:
+            time = segment
+        else:
+            word_times += [time] * len(text_only(segment).split())
+    return word_times
+
 def process_lines(lines):
+    """
+    Get the timebound, text, per-word start times and cue end time of each transcript line.
+    """
     timebounds = []
     lines_txt = []
+    word_times = []
+    ends = []
 
     previous_singleton = None
     previous_timebound = "00:00:00.000"
+    cue_start = "00:00:00.000"
+    cue_end = "00:00:00.000"
 
     for line in lines:
+        # if line is a cue header
+        if '-->' in line:
+            cue_times = re.findall(TIME_FORMAT, line)
+            if len(cue_times) >= 2:
+                cue_start, cue_end = cue_times[0], cue_times[1]
+
         # if line is one of the chunks introducing new text
         if re.search(r'</c>', line):
             timebound = get_timebound_in_line(line)
             timebounds.append(timebound)
             previous_timebound = timebound
             lines_txt.append(text_only(line))
+            word_times.append(get_word_times_in_line(line, cue_start))
+            ends.append(cue_end)
 
         # if the line is a singleton with no </c>
         if re.match(r'^\w+\n$', line):
@@ -49,22 +79,26 @@ def process_lines(lines):
             if line_word != previous_singleton:
                 timebounds.append(previous_timebound)
                 lines_txt.append(line_word)
+                word_times.append([previous_timebound])
+                ends.append(cue_end)
                 previous_singleton = line_word
 
-    return timebounds, lines_txt
+    return timebounds, lines_txt, word_times, ends
 
 def convert_to_tsv(input_file, output_file):
     with open(input_file, encoding='utf-8', errors="ignore") as f:
         lines = f.readlines()
 
-    timebounds, lines_txt = process_lines(lines)
+    timebounds, lines_txt, word_times, ends = process_lines(lines)
 
     with open(output_file, 'w+', encoding='utf-8', errors='ignore') as f:
-        f.write("start\ttext\n")
+        f.write("start\ttext\tword_times\tend\n")
         for i in range(len(timebounds)):
             f.write(
                 timebounds[i] + "\t" +
-                lines_txt[i] + "\n"
+                lines_txt[i] + "\t" +
+                " ".join(word_times[i]) + "\t" +
+                ends[i] + "\n"
             )
 
 
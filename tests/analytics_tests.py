@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "phrase_getter"))
+
+import analytics
+
+
+def counts(rows):
+    return pd.DataFrame(rows, columns=analytics.COUNT_COLUMNS)
+
+
+COUNTS = counts([
+    ("vid0", "First", "2024-01-05T00:00:00Z", 2.0, "game theory", 4),
+    ("vid1", "Second", "2024-01-20T00:00:00Z", 1.0, "game theory", 2),
+    ("vid2", "Third", "2024-02-01T00:00:00Z", 0.0, "game theory", 0),
+    ("vid3", "Undated", "", 1.0, "game theory", 5),
+])
+
+
+class PerMonthTest(unittest.TestCase):
+    def test_months(self):
+        table = analytics.per_month(COUNTS)
+        self.assertEqual(list(table["month"]), ["2024-01", "2024-02"])
+        self.assertEqual(list(table["videos"]), [2, 1])
+        self.assertEqual(list(table["count"]), [6, 0])
+        self.assertEqual(list(table["hours"]), [3.0, 0.0])
+        self.assertEqual(table["rate_per_hour"][0], 2.0)
+
+    def test_zero_hours_has_no_rate(self):
+        table = analytics.per_month(COUNTS)
+        self.assertTrue(pd.isna(table["rate_per_hour"][1]))
+
+    def test_undated_videos_are_dropped(self):
+        table = analytics.per_month(COUNTS)
+        self.assertEqual(table["count"].sum(), 6)
+
+    def test_phrases_are_kept_apart(self):
+        both = pd.concat([COUNTS, COUNTS.assign(phrase="evolution", count=1)], ignore_index=True)
+        table = analytics.per_month(both)
+        self.assertEqual(list(zip(table["phrase"], table["month"], table["count"])), [
+            ("evolution", "2024-01", 2), ("evolution", "2024-02", 1),
+            ("game theory", "2024-01", 6), ("game theory", "2024-02", 0),
+        ])
+
+
+class PerVideoTest(unittest.TestCase):
+    def test_rates(self):
+        table = analytics.per_video(COUNTS).set_index("video_id")
+        self.assertEqual(table.loc["vid0", "rate_per_hour"], 2.0)
+        self.assertEqual(table.loc["vid1", "rate_per_hour"], 2.0)
+        self.assertTrue(pd.isna(table.loc["vid2", "rate_per_hour"]))
+
+    def test_undated_videos_are_kept(self):
+        table = analytics.per_video(COUNTS)
+        self.assertEqual(list(table["video_id"]), ["vid3", "vid0", "vid1", "vid2"])
+
+    def test_unknown_grouping(self):
+        with self.assertRaises(ValueError):
+            analytics.aggregate(COUNTS, "year")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from transcript_fixtures import make_index
+
+import fuzzy
+
+
+def mutate(word, rng):
+    i = rng.randrange(len(word) + 1)
+    edit = rng.choice(["insert", "delete", "replace"])
+    if edit == "insert" or len(word) == 0:
+        return word[:i] + rng.choice("abcde") + word[i:]
+    i = min(i, len(word) - 1)
+    if edit == "delete":
+        return word[:i] + word[i + 1:]
+    return word[:i] + rng.choice("abcde") + word[i + 1:]
+
+
+class EditDistanceTest(unittest.TestCase):
+    def test_distance(self):
+        self.assertEqual(fuzzy.edit_distance("kitten", "sitting", 5), 3)
+        self.assertEqual(fuzzy.edit_distance("game", "game", 0), 0)
+        self.assertEqual(fuzzy.edit_distance("", "abc", 3), 3)
+
+    def test_distance_is_capped(self):
+        self.assertEqual(fuzzy.edit_distance("kitten", "sitting", 2), 3)
+        self.assertEqual(fuzzy.edit_distance("a", "abcdef", 1), 2)
+
+
+class CandidateWordsTest(unittest.TestCase):
+    def test_ngram_filter_matches_brute_force(self):
+        rng = random.Random(0)
+        words = ["a", "an", "bad", "game", "gain", "theory", "theories", "abcdeab", "cabbage", "deadbeef"]
+        vocabulary = set(words)
+        for word in words:
+            mutated = word
+            for _ in range(12):
+                mutated = mutate(mutated, rng)
+                vocabulary.add(mutated)
+        vocabulary = sorted(vocabulary)
+        ngram_index = fuzzy.build_ngram_index(vocabulary)
+
+        for max_distance in range(4):
+            for word in words:
+                with self.subTest(word=word, max_distance=max_distance):
+                    matcher = fuzzy.make_matcher(word, max_distance)
+                    expected = {}
+                    for other in vocabulary:
+                        distance = fuzzy.edit_distance(word, other, len(word) + len(other))
+                        if distance <= max_distance:
+                            expected[other] = distance
+                    self.assertEqual(fuzzy.candidate_words(matcher, 0, vocabulary, ngram_index), expected)
+
+    def test_index_prunes_candidates(self):
+        index = make_index("we discuss game theory and this is how the other thing works with them")
+        matcher = fuzzy.make_matcher("gain theory", 2)
+        self.assertEqual(matcher["ngram_sizes"], [2, 2])
+        fuzzy.find_matches(matcher, index)
+
+        # Only words sharing enough bigrams were checked with an edit distance
+        length_plausible = [word for word in index["vocabulary"] if abs(len(word) - len("gain")) <= 2]
+        self.assertEqual(sorted(matcher["verified"][0]), ["game", "thing"])
+        self.assertLess(len(matcher["verified"][0]), len(length_plausible))
+        self.assertEqual(sorted(matcher["verified"][1]), ["the", "them", "theory"])
+        self.assertNotIn("other", matcher["verified"][1])
+
+    def test_short_words_fall_back_to_length(self):
+        self.assertEqual(fuzzy.make_matcher("a an game", 3)["ngram_sizes"], [None, None, None])
+        self.assertEqual(fuzzy.make_matcher("an game theory", 1)["ngram_sizes"], [2, 3, 3])
+
+
+class FindMatchesTest(unittest.TestCase):
+    def test_distance_is_summed_over_the_phrase(self):
+        index = make_index("we discuss game theory today")
+        self.assertEqual(fuzzy.find_matches(fuzzy.make_matcher("gain theory", 2), index), [(2, 3, 0.8)])
+        self.assertEqual(fuzzy.find_matches(fuzzy.make_matcher("gain theory", 1), index), [])
+        self.assertEqual(fuzzy.find_matches(fuzzy.make_matcher("gain theoyr", 3), index), [])
+
+    def test_overlapping_matches_are_dropped(self):
+        index = make_index("a a a a a")
+        self.assertEqual(fuzzy.find_matches(fuzzy.make_matcher("a a", 0), index), [(0, 1, 1.0), (2, 3, 1.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
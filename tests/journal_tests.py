@@ -0,0 +1,56 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "phrase_getter"))
+
+import journal
+
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "journals", "phrase.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_replay_keeps_latest_status(self):
+        key = journal.row_key("abc", "00:00:01.000")
+        journal.reset_journal(self.path)
+        journal.record(self.path, [{"key": key, "row": 0, "status": "pending"}])
+        journal.record(self.path, [{"key": key, "row": 0, "status": "done", "path": "clip.mp4"}])
+
+        entries = journal.load_journal(self.path)
+        self.assertEqual(entries[key]["status"], "done")
+        self.assertEqual(entries[key]["path"], "clip.mp4")
+
+    def test_truncated_last_line_is_ignored(self):
+        first = journal.row_key("abc", "00:00:01.000")
+        second = journal.row_key("def", "00:00:02.000")
+        journal.reset_journal(self.path)
+        journal.record(self.path, [
+            {"key": first, "row": 0, "status": "done", "path": "clip.mp4"},
+            {"key": second, "row": 1, "status": "pending"},
+        ])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"key": "' + second + '", "row": 1, "sta')
+
+        entries = journal.load_journal(self.path)
+        self.assertEqual(entries[first]["status"], "done")
+        self.assertEqual(entries[second]["status"], "pending")
+        self.assertEqual(journal.summarize(entries)["done"], 1)
+
+    def test_missing_journal_is_empty(self):
+        self.assertEqual(journal.load_journal(self.path), {})
+
+    def test_unknown_status_is_rejected(self):
+        journal.reset_journal(self.path)
+        with self.assertRaises(ValueError):
+            journal.record(self.path, [{"key": "abc@00:00:01.000", "row": 0, "status": "finished"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from transcript_fixtures import stamp, timed_rows, write_transcript
+
+import phrase_getter
+
+
+class IncrementalManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.transcripts = os.path.join(self.directory, "channel", "transcripts_tsv")
+        os.makedirs(self.transcripts)
+        self.write("vid0", "so game theory is fun")
+        self.write("vid1", "no match here and game theory again")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, video_id, text):
+        write_transcript(os.path.join(self.transcripts, f"{video_id}---Title {video_id}.tsv"), timed_rows(text))
+
+    def config(self, **args):
+        return phrase_getter.make_config(dict({
+            "phrase": "game theory",
+            "channel_name": "channel",
+            "output_directory": self.directory + "/",
+            "skip_download": True,
+            "max_files": None,
+            "skip_manifest": False,
+            "viseme_equivalent": False,
+            "progress": lambda message: None,
+        }, **args))
+
+    def run_manifest(self, **args):
+        config = self.config(**args)
+        results = phrase_getter.make_manifest(config)
+        return config, [(result["video_id"], result["timestamp"]) for result in results]
+
+    def manifest_rows(self, config):
+        return [(row["video_id"], row["timestamp"]) for row in phrase_getter.read_manifest_rows(config)]
+
+    def covered(self, config):
+        return sorted(phrase_getter.load_manifest_index(config)["transcripts"])
+
+    def add_stale_row(self, config):
+        """Add a row that only a full rescan would drop, to tell updates from rebuilds."""
+        with open(config["paths"]["manifest"], "a", encoding="utf-8") as f:
+            f.write("vid0,Title vid0,game theory,00:09:00.000,,\n")
+
+    def test_first_run_writes_manifest_and_index(self):
+        config, rows = self.run_manifest()
+        self.assertEqual(sorted(rows), [("vid0", "00:00:01.000"), ("vid1", "00:00:04.000")])
+        self.assertEqual(sorted(self.manifest_rows(config)), sorted(rows))
+        self.assertEqual(self.covered(config), ["vid0---Title vid0", "vid1---Title vid1"])
+
+    def test_new_transcript_is_added(self):
+        config, _ = self.run_manifest()
+        self.add_stale_row(config)
+        self.write("vid2", "game theory")
+
+        config, rows = self.run_manifest()
+        self.assertIn(("vid2", "00:00:00.000"), rows)
+        # Unchanged transcripts are not rescanned
+        self.assertIn(("vid0", "00:09:00.000"), self.manifest_rows(config))
+        self.assertEqual(len(self.covered(config)), 3)
+
+    def test_changed_transcript_is_rescanned(self):
+        config, _ = self.run_manifest()
+        self.add_stale_row(config)
+        self.write("vid0", "nothing to see then game theory")
+
+        config, rows = self.run_manifest()
+        self.assertEqual(sorted(self.manifest_rows(config)), [("vid0", "00:00:04.000"), ("vid1", "00:00:04.000")])
+        self.assertEqual(sorted(rows), sorted(self.manifest_rows(config)))
+
+    def test_deleted_transcript_is_dropped(self):
+        config, _ = self.run_manifest()
+        os.remove(os.path.join(self.transcripts, "vid1---Title vid1.tsv"))
+
+        config, rows = self.run_manifest()
+        self.assertEqual(self.manifest_rows(config), [("vid0", "00:00:01.000")])
+        self.assertEqual(self.covered(config), ["vid0---Title vid0"])
+
+    def test_rebuild_when_settings_differ(self):
+        config, _ = self.run_manifest()
+        self.add_stale_row(config)
+        with open(config["paths"]["manifest_index"]) as f:
+            index = json.load(f)
+        index["settings"]["columns"] = index["settings"]["columns"][:-1]
+        with open(config["paths"]["manifest_index"], "w") as f:
+            json.dump(index, f)
+
+        config, _ = self.run_manifest()
+        self.assertNotIn(("vid0", "00:09:00.000"), self.manifest_rows(config))
+        self.assertEqual(phrase_getter.load_manifest_index(config)["settings"], phrase_getter.manifest_settings(config))
+
+    def test_rebuild_manifest_rescans_everything(self):
+        config, _ = self.run_manifest()
+        self.add_stale_row(config)
+
+        config, _ = self.run_manifest(rebuild_manifest=True)
+        self.assertNotIn(("vid0", "00:09:00.000"), self.manifest_rows(config))
+
+    def test_cancelled_run_writes_nothing(self):
+        cancel = threading.Event()
+        cancel.set()
+        config, _ = self.run_manifest(cancel=cancel)
+        self.assertFalse(os.path.exists(config["paths"]["manifest"]))
+        self.assertFalse(os.path.exists(config["paths"]["manifest_index"]))
+
+        config, _ = self.run_manifest()
+        self.write("vid2", "game theory")
+        self.run_manifest(cancel=cancel)
+        self.assertEqual(len(self.covered(config)), 2)
+        self.assertEqual(len(self.manifest_rows(config)), 2)
+
+
+class MatchTimesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.transcripts = os.path.join(self.directory, "channel", "transcripts_tsv")
+        os.makedirs(self.transcripts)
+        self.config = phrase_getter.make_config({
+            "phrase": "game theory",
+            "channel_name": "channel",
+            "output_directory": self.directory + "/",
+            "skip_manifest": False,
+            "viseme_equivalent": False,
+            "seconds_before": 1,
+            "seconds_after": 5,
+            "tight": True,
+            "progress": lambda message: None,
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def instances(self, rows, columns=("start", "text", "word_times", "end")):
+        write_transcript(os.path.join(self.transcripts, "vid0---Title.tsv"), rows, columns)
+        return phrase_getter.get_instances("vid0---Title", self.config)
+
+    def test_word_timings_give_the_phrase_end(self):
+        instances = self.instances(timed_rows("so game theory is fun", words_per_row=2))
+        self.assertEqual(instances, [{"timestamp": stamp(1), "end_timestamp": stamp(3)}])
+
+    def test_two_column_transcript_has_no_end(self):
+        rows = [{"start": "00:00:02.000", "text": "so game theory is"}, {"start": "00:00:09.000", "text": "fun"}]
+        instances = self.instances(rows, columns=("start", "text"))
+        self.assertEqual(instances, [{"timestamp": "00:00:02.000", "end_timestamp": ""}])
+
+        # Tight clips fall back to seconds_before and seconds_after
+        start, end = phrase_getter.clip_window(
+            instances[0]["timestamp"], self.config, instances[0]["end_timestamp"] or None
+        )
+        self.assertEqual((start.strftime("%H:%M:%S"), end.strftime("%H:%M:%S")), ("00:00:01", "00:00:07"))
+
+
+class CountPhrasesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        transcripts = os.path.join(self.directory, "channel", "transcripts_tsv")
+        os.makedirs(transcripts)
+        write_transcript(os.path.join(transcripts, "vid0---Title.tsv"), [
+            {"start": "00:00:02.000", "text": "the endgame theory"},
+            {"start": "00:00:05.000", "text": "game theory's end OR"},
+        ], columns=("start", "text"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def config(self, **args):
+        return phrase_getter.make_config(dict({
+            "phrase": "game theory",
+            "channel_name": "channel",
+            "output_directory": self.directory + "/",
+            "skip_manifest": False,
+            "viseme_equivalent": False,
+            "analytics": "video",
+            "progress": lambda message: None,
+        }, **args))
+
+    def test_counts_match_the_manifest(self):
+        config = self.config()
+        instances = phrase_getter.get_instances("vid0---Title", config)
+        counts = phrase_getter.count_phrases(config)
+        self.assertEqual(len(instances), 2)
+        self.assertEqual(list(counts["count"]), [2])
+
+    def test_plain_phrases_are_not_queries(self):
+        counts = phrase_getter.count_phrases(self.config(phrase="end OR"))
+        self.assertEqual(list(counts["count"]), [1])
+
+    def test_query_counts(self):
+        counts = phrase_getter.count_phrases(self.config(phrase="game theory OR endgame", query=True))
+        self.assertEqual(list(counts["count"]), [1])
+
+    def test_fuzzy_analytics_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.config(fuzzy=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from transcript_fixtures import make_index, load_fixture_index, normalize, stamp, timed_rows
+
+import query
+
+
+def matches(text, query_text):
+    return query.find_matches(query.parse(query_text, normalize), make_index(text))
+
+
+class ParseTest(unittest.TestCase):
+    def test_precedence(self):
+        tree = query.parse("Game theory OR games NEAR/2 theory", normalize)
+        self.assertEqual(tree, ("or", [
+            ("seq", [("word", "game"), ("word", "theory")]),
+            ("near", 2, ("word", "games"), ("word", "theory")),
+        ]))
+
+    def test_wildcards_and_prefixes(self):
+        tree = query.parse("game * theor*", normalize)
+        self.assertEqual(tree, ("seq", [("word", "game"), ("any",), ("prefix", "theor")]))
+
+    def test_malformed_queries(self):
+        for text in ["", "game OR", "OR game", "(game theory", "game theory)", "* *", "!!!", "game NEAR/2"]:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    query.parse(text, normalize)
+
+
+class FindMatchesTest(unittest.TestCase):
+    def test_sequence(self):
+        self.assertEqual(matches("we like game theory and game shows", "game theory"), [(2, 3)])
+
+    def test_wildcard_and_prefix(self):
+        self.assertEqual(matches("game of theory and game theories", "game * theor*"), [(0, 2)])
+        self.assertEqual(matches("theory and theories", "theor*"), [(0, 0), (2, 2)])
+
+    def test_near_in_both_orders(self):
+        text = "game a b theory x x x x theory c game"
+        self.assertEqual(matches(text, "game NEAR/2 theory"), [(0, 3), (8, 10)])
+        self.assertEqual(matches(text, "game NEAR/1 theory"), [(8, 10)])
+
+    def test_overlapping_matches_are_dropped(self):
+        self.assertEqual(matches("a a a a a", "a a"), [(0, 1), (2, 3)])
+
+    def test_shortest_match_is_kept(self):
+        self.assertEqual(matches("game theory", "game theory OR game"), [(0, 0)])
+
+    def test_transcript_words_are_normalized(self):
+        index = load_fixture_index(timed_rows("So, Game Theory's end... -- game theory!", words_per_row=3))
+        self.assertEqual(index["tokens"], ["so", "game", "theorys", "end", "game", "theory"])
+        self.assertEqual(query.find_matches(query.parse("GAME theory", normalize), index), [(4, 5)])
+
+    def test_match_times_come_from_word_timings(self):
+        index = make_index("we like game theory and game shows", words_per_row=3)
+        first, last = query.find_matches(query.parse("game theory", normalize), index)[0]
+        self.assertEqual((index["starts"][first], index["ends"][last]), (stamp(2), stamp(4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
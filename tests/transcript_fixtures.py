@@ -0,0 +1,63 @@
+"""
+Small TSV transcripts for tests, written to a temporary directory and loaded the way
+phrase_getter loads them.
+"""
+import os
+import re
+import sys
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "phrase_getter"))
+
+import transcript_index
+
+
+def normalize(text):
+    """Same normalization as phrase_getter.norm_txt."""
+    return re.sub(r'[^a-zA-Z0-9\s]', '', text).lower().strip()
+
+
+def stamp(seconds):
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}.000"
+
+
+def timed_rows(text, words_per_row=4):
+    """
+    Rows of an auto-generated transcript for text, with word_times and end columns.
+    Each word starts one second after the previous one.
+    """
+    words = text.split()
+    rows = []
+    for first in range(0, len(words), words_per_row):
+        row_words = words[first:first + words_per_row]
+        times = [stamp(first + j) for j in range(len(row_words))]
+        rows.append({
+            "start": times[0],
+            "text": " ".join(row_words),
+            "word_times": " ".join(times),
+            "end": stamp(first + len(row_words)),
+        })
+    return rows
+
+
+def write_transcript(path, rows, columns=("start", "text", "word_times", "end")):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\t".join(columns) + "\n")
+        for row in rows:
+            f.write("\t".join(str(row[column]) for column in columns) + "\n")
+
+
+def load_fixture_index(rows, columns=("start", "text", "word_times", "end"), normalize=normalize):
+    """Write rows as a TSV transcript and load it with transcript_index.load_index."""
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "video---Title.tsv")
+        write_transcript(path, rows, columns)
+        return transcript_index.load_index(path, normalize)
+    finally:
+        shutil.rmtree(directory)
+
+
+def make_index(text, words_per_row=4):
+    return load_fixture_index(timed_rows(text, words_per_row))
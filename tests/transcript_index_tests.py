@@ -0,0 +1,32 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from transcript_fixtures import load_fixture_index, stamp, timed_rows
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_word_timings(self):
+        index = load_fixture_index(timed_rows("so game theory is fun", words_per_row=3))
+        self.assertEqual(index["tokens"], ["so", "game", "theory", "is", "fun"])
+        self.assertEqual(index["starts"], [stamp(i) for i in range(5)])
+        self.assertEqual(index["ends"], [stamp(i) for i in range(1, 6)])
+
+    def test_two_column_transcript_has_no_word_ends(self):
+        rows = [{"start": "00:00:02.000", "text": "so game theory"}, {"start": "00:00:09.000", "text": "is fun"}]
+        index = load_fixture_index(rows, columns=("start", "text"))
+        self.assertEqual(index["starts"], ["00:00:02.000"] * 3 + ["00:00:09.000"] * 2)
+        self.assertEqual(index["ends"], [""] * 5)
+
+    def test_rows_with_mismatched_timings_have_no_word_ends(self):
+        rows = timed_rows("so game theory is fun", words_per_row=3)
+        rows[0]["word_times"] = stamp(0)
+        index = load_fixture_index(rows)
+        self.assertEqual(index["starts"][:3], [stamp(0)] * 3)
+        self.assertEqual(index["ends"], ["", "", "", stamp(4), stamp(5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
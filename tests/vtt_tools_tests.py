@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "phrase_getter"))
+
+import vtt_tools as vtt
+
+# One cue of a YouTube auto-generated transcript
+AUTO_CUE = [
+    "00:00:00.800 --> 00:00:03.350 align:start position:0%\n",
+    "so<00:00:01.120><c> game</c><00:00:01.440><c> theory</c><00:00:02.000><c> is</c>\n",
+    "\n",
+]
+
+
+class WordTimesTest(unittest.TestCase):
+    def test_word_times_in_line(self):
+        self.assertEqual(vtt.get_word_times_in_line(AUTO_CUE[1], "00:00:00.800"), [
+            "00:00:00.800", "00:00:01.120", "00:00:01.440", "00:00:02.000"
+        ])
+
+    def test_line_without_tags(self):
+        self.assertEqual(vtt.get_word_times_in_line("so game theory\n", "00:00:00.800"), ["00:00:00.800"] * 3)
+
+    def test_process_lines(self):
+        timebounds, lines_txt, word_times, ends = vtt.process_lines(AUTO_CUE)
+        self.assertEqual(timebounds, ["00:00:01.120"])
+        self.assertEqual(lines_txt, ["so game theory is"])
+        self.assertEqual(word_times, [["00:00:00.800", "00:00:01.120", "00:00:01.440", "00:00:02.000"]])
+        self.assertEqual(ends, ["00:00:03.350"])
+
+
+if __name__ == '__main__':
+    unittest.main()